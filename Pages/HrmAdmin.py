@@ -1,5 +1,6 @@
 import logging
-import time
+
+from selenium.webdriver.common.by import By
 
 from webdriver.WebDriverHelperNew import WebDriverHelper
 from config.TestConfig import TestConfig
@@ -27,17 +28,15 @@ class HrmAdmin(WebDriverHelper):
     def getListOfAdminMenu(self):
         log.info("fetch the list of the admin menu")
         element = self.find_element('visible', 'xpath', "//li[contains(@class,'oxd-topbar-body-nav-tab')]", 50)
-        menus = self.get_elements(element_xpath="//li[contains(@class,'oxd-topbar-body-nav-tab')]")
-        actual_field = []
-        for value in menus:
-            text = value.get_attribute('innerText')
-            log.info(f"{text}")
-            actual_field.append(text)
+        menus = self.extract_elements((By.XPATH, "//li[contains(@class,'oxd-topbar-body-nav-tab')]"),
+                                      {'text': 'prop:innerText'})
+        actual_field = [menu['text'] for menu in menus]
+        log.info(f"{actual_field}")
         return actual_field
 
     def verify_admin_menu_option(self, admin_menu):
         self.clickAdminTab()
-        time.sleep(2)
+        self.wait_for_app_settled(wait_time=2)
         actual_list = self.getListOfAdminMenu()
         log.info(f"{actual_list}")
         assert admin_menu == actual_list
@@ -1,13 +1,21 @@
 import logging
-import time
+
+from selenium.webdriver.common.by import By
 
 from webdriver.WebDriverHelperNew import WebDriverHelper
+from webdriver.SessionSnapshot import SessionSnapshot
 from config.TestConfig import TestConfig
 
 log = logging.getLogger(__name__)
 
 
 class HrmLogin(WebDriverHelper):
+    USERNAME_INPUT = (By.XPATH, "//input[@name='username']")
+    PASSWORD_INPUT = (By.XPATH, "//input[@name='password']")
+    LOGIN_BUTTON = (By.XPATH, "//button[@type='submit']")
+
+    session_snapshot = SessionSnapshot()
+
     def __init__(self, driver):
         """
         Initializes the HrmLogin page object with the WebDriver instance.
@@ -42,10 +50,27 @@ class HrmLogin(WebDriverHelper):
     def login_to_hrm_application(self, username, password):
         self.driver.get(self.data.url)
         self.driver.maximize_window()
-        time.sleep(2)  # Consider replacing this with WebDriverWait for better handling
-        self.set_username(username)
-        self.set_password(password)
-        self.click_login_button()
+        self.fill_form({self.USERNAME_INPUT: username, self.PASSWORD_INPUT: password},
+                       submit=self.LOGIN_BUTTON, comment="login form")
+        log.info("Login form submitted for: %s", username)
+
+    def is_logged_in(self):
+        """OrangeHRM redirects authenticated users away from the login page."""
+        return "/auth/login" not in self.driver.current_url
+
+    def login_with_session_snapshot(self, username, password):
+        """
+        Logs in by restoring the stored session of the user, and only goes through
+        the login form when there is no valid snapshot or it is rejected.
+        """
+        self.driver.maximize_window()
+        self.session_snapshot.login(
+            self.driver,
+            role=username,
+            url=self.data.url,
+            ui_login=lambda: self.login_to_hrm_application(username, password),
+            is_logged_in=self.is_logged_in
+        )
 
     def verify_current_url(self):
         url = self.driver.current_url
@@ -56,7 +81,7 @@ class HrmLogin(WebDriverHelper):
 
     def click_on_admin_menu(self, admin_url):
         self.click_admin_tab()
-        time.sleep(2)  # Consider replacing this with WebDriverWait for better handling
+        self.wait_for_app_settled(wait_time=2)
         url = self.driver.current_url
         log.info("Fetched current URL: %s", url)
         log.info("Verifying if URL matches admin URL...")
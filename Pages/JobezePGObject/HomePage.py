@@ -49,10 +49,18 @@ class HomePage:
     LOCATION_INPUT= (By.XPATH,"//input[@placeholder='Location']")
     JOB_SEARCH_BUTTON = (By.XPATH,"//button[normalize-space()='Search']")
 
+    # Readiness signature: the page is usable once the search form is visible
+    READY_LOCATORS = (SKILL_TEXTBOx, LOCATION_INPUT, JOB_SEARCH_BUTTON)
+    READY_SCRIPT = None
+
     def __init__(self, driver):
         self.driver = driver
         self.helper = WebDriverHelper(driver)
 
+    def wait_until_ready(self):
+        log.info("Waiting for Home page to be ready")
+        self.helper.wait_for_page_ready(self)
+
     def click_home_link(self):
         log.info("Clicking Home link on navbar")
         self.helper.click_element(self.HOME_LINK, "Clicking Home link")
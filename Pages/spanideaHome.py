@@ -1,5 +1,4 @@
 import logging
-import time
 from webdriver.WebDriverHelperNew import WebDriverHelper
 from config.TestConfig import TestConfig
 
@@ -20,7 +19,7 @@ class SpanideaHome(WebDriverHelper):
         """Launches the Spanidea application."""
         log.info(f"Launching application at {self.data.url1}")
         self.go_to_url(self.data.url1)
-        time.sleep(2)  # Consider using a more robust wait method
+        self.wait_for_app_settled(wait_time=2)
         log.info("User able to launch the Spanidea application")
 
     def verify_current_url(self):
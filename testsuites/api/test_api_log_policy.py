@@ -0,0 +1,82 @@
+import json
+import logging
+
+import pytest
+
+from utils.service_api.ApiLogPolicy import ApiLogPolicy
+from utils.service_api.ServiceAPINew import ServiceAPI
+from utils.service_api.StubServer import StubServer
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("0123456789", "0123456789"),
+    ("0123456789A", "01234 ...[1 bytes truncated]... 6789A"),
+    (b"x" * 30, "xxxxx ...[20 bytes truncated]... xxxxx"),
+    ({"id": 1}, '{"id": 1}'),
+    (None, ""),
+])
+def test_truncate_keeps_head_and_tail(content, expected):
+    """Bodies up to max_body_bytes are kept whole; longer ones keep half the limit at each end."""
+    assert ApiLogPolicy(max_body_bytes=10).truncate(content) == expected
+
+
+def test_truncate_without_limit():
+    assert ApiLogPolicy(max_body_bytes=0).truncate("y" * 5000) == "y" * 5000
+
+
+def test_parse_sampling():
+    assert ApiLogPolicy.parse_sampling(["/user-info=0.1", " /create-user=0.5 ", "no-rate"]) == \
+        {"/user-info": 0.1, "/create-user": 0.5}
+
+
+def test_sampling_is_counted_per_pattern():
+    """URLs that differ only by id share their pattern's sample; unmatched URLs are always logged."""
+    policy = ApiLogPolicy(sampling={"/user-info": 0.1, "/health": 0})
+    logged = [policy.should_log_body(f"http://backend/user-info/{user_id}") for user_id in range(100)]
+
+    assert sum(logged) == 10
+    assert logged.index(True) == 9
+    assert not any(policy.should_log_body("http://backend/health") for _ in range(10))
+    assert all(policy.should_log_body(f"http://backend/create-user/{user_id}") for user_id in range(10))
+
+
+def test_first_matching_pattern_wins():
+    policy = ApiLogPolicy(sampling={"/user": 1.0, "/user-info": 0})
+    assert policy.should_log_body("http://backend/user-info/1")
+
+
+def test_response_body_is_truncated_in_the_log(caplog):
+    policy = ApiLogPolicy(max_body_bytes=8)
+    with StubServer({('GET', '/user-info/1'): (200, {"name": "a" * 100})}) as server:
+        client = ServiceAPI(token="stub-token")
+        try:
+            response = client.session.get(f"{server.url}/user-info/1")
+        finally:
+            client.close()
+
+    with caplog.at_level(logging.INFO):
+        policy.log_response(logging.getLogger("api"), response)
+    assert 'Response Content: {"na ...[' in caplog.text
+    assert "a" * 20 not in caplog.text
+
+
+def test_full_exchange_is_written_on_failure(tmp_path, monkeypatch):
+    """The buffered request and response of a failing call are written whole, however small the log cap."""
+    monkeypatch.setattr(ServiceAPI, 'log_policy', ApiLogPolicy(max_body_bytes=16))
+    payload = {"email": "user@example.com", "bio": "b" * 200}
+    with StubServer({('POST', '/create-user'): (500, {"error": "e" * 200})}) as server:
+        client = ServiceAPI(token="stub-token")
+        try:
+            client.post_service_response(f"{server.url}/create-user", payload)
+        finally:
+            client.close()
+
+    path = ServiceAPI.log_policy.write_full_exchanges(str(tmp_path / "ApiLogs" / "test.log"))
+    content = (tmp_path / "ApiLogs" / "test.log").read_text()
+    assert path.endswith("test.log")
+    assert f"POST {server.url}/create-user" in content
+    assert json.dumps(payload) in content
+    assert "500 Internal Server Error" in content
+    assert "e" * 200 in content
+    # The buffer is emptied, so the next failing test only gets its own exchanges
+    assert ServiceAPI.log_policy.write_full_exchanges(str(tmp_path / "ApiLogs" / "again.log")) is None
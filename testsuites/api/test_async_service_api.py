@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from utils.service_api.AsyncServiceAPI import AsyncServiceAPI
+from utils.service_api.StubServer import StubServer
+
+USERS = 200
+RESPONSE_DELAY = 0.02
+
+USER_SCHEMA = {
+    "type": "object",
+    "properties": {"user_id": {"type": "integer"}, "email": {"type": "string"}},
+    "required": ["user_id", "email"],
+}
+
+
+def user_info(method, path, body):
+    time.sleep(RESPONSE_DELAY)
+    user_id = int(path.rsplit('/', 1)[1])
+    return 200, {"user_id": user_id, "email": f"user{user_id}@example.com"}
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    """Local stand-in for the backend, so these tests run offline."""
+    with StubServer({('GET', '/user-info/*'): user_info,
+                     ('POST', '/create-user'): (200, {"message": {"user_id": 1}})}) as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def async_api():
+    api = AsyncServiceAPI(token="stub-token", concurrency=20)
+    yield api
+    api.close()
+
+
+def test_gather_user_info(async_api, stub_server):
+    """Fetches user-info for many users concurrently and validates every response."""
+    start = time.perf_counter()
+    responses = async_api.run(async_api.gather(
+        *(async_api.get_service_response(f"{stub_server.url}/user-info/{user_id}") for user_id in range(USERS))))
+    elapsed = time.perf_counter() - start
+
+    assert [response.json()["user_id"] for response in responses] == list(range(USERS))
+    for response in responses:
+        async_api.validate_response(response, expected_status=200)
+        async_api.validate_json_schema(response, USER_SCHEMA)
+    # Sequential requests would take at least USERS * RESPONSE_DELAY
+    assert elapsed < USERS * RESPONSE_DELAY / 2
+
+
+def test_post_and_custom_headers(async_api, stub_server):
+    """Sends a POST and a request with custom headers through the async client."""
+    created = async_api.run(async_api.post_service_response(f"{stub_server.url}/create-user", {"email": "a@b.c"}))
+    async_api.validate_response(created, expected_status=200)
+    assert created.json()["message"]["user_id"] == 1
+
+    response = async_api.run(async_api.custom_headers_request(
+        f"{stub_server.url}/health", headers={"X-Probe": "1"}, method="GET"))
+    assert "Authorization" not in response.request.headers
+    assert response.request.headers["X-Probe"] == "1"
@@ -0,0 +1,91 @@
+import json
+import os
+import time
+import uuid
+import itertools
+
+import allure
+import pytest
+
+from utils.service_api.LoadTest import LoadTest, LatencyHistogram
+from utils.service_api.ServiceAPINew import ServiceAPI
+from utils.service_api.StubServer import StubServer
+
+CONCURRENCY = 10
+ITERATIONS = 100
+
+
+@pytest.fixture(scope="module")
+def user_payload():
+    """The create-user payload from config/api_config.json."""
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    with open(os.path.join(project_root, 'config', 'api_config.json')) as config_file:
+        return json.load(config_file)['api_payload']['user']
+
+
+def create_and_fetch_user(base_url, payload):
+    """Scenario: create a user with a unique email, then read it back through user-info/{id}."""
+    def scenario(run, iteration):
+        created = run.request('create-user', 'POST', f"{base_url}/create-user",
+                              dict(payload, email=f"loadtest_{uuid.uuid4().hex[:8]}@example.com"))
+        user_id = created.json()['message']['user_id']
+        run.request('user-info', 'GET', f"{base_url}/user-info/{user_id}")
+    return scenario
+
+
+def attach_result(result, name):
+    json_path, html_path = result.write(name)
+    allure.attach.file(html_path, name=f"Load test: {name}", attachment_type=allure.attachment_type.HTML)
+    return json_path
+
+
+def test_latency_histogram_percentiles():
+    """Percentiles of the bucketed histogram stay within its precision of the exact values."""
+    histogram = LatencyHistogram(significant_figures=3)
+    for value in range(1, 10001):
+        histogram.record(value / 10)
+    assert histogram.percentile(50) == pytest.approx(500, rel=1e-3)
+    assert histogram.percentile(99) == pytest.approx(990, rel=1e-3)
+    assert histogram.percentile(100) == 1000
+    assert len(histogram.buckets) < histogram.count
+
+
+def test_load_scenario_against_stub(user_payload):
+    """Replays the create-user / user-info scenario against a local stub and checks the report."""
+    user_ids = itertools.count(1)
+
+    def create_user(method, path, body):
+        return 200, {"message": {"user_id": next(user_ids)}}
+
+    def user_info(method, path, body):
+        time.sleep(0.005)
+        return 200, {"user_id": int(path.rsplit('/', 1)[1])}
+
+    api = ServiceAPI(token="stub-token", pool_size=CONCURRENCY)
+    with StubServer({('POST', '/create-user'): create_user, ('GET', '/user-info/*'): user_info}) as server:
+        result = LoadTest(api, create_and_fetch_user(server.url, user_payload),
+                          concurrency=CONCURRENCY).run(iterations=ITERATIONS)
+    api.close()
+
+    attach_result(result, "stub_create_and_fetch_user")
+    assert result.summary['requests'] == 2 * ITERATIONS
+    assert result.step('user-info')['p50_ms'] >= 5
+    result.assert_error_rate(max_rate=0.0)
+    result.assert_percentile('user-info', 99, max_ms=1000)
+
+
+def test_load_create_and_fetch_user(request, api_session, auth_token, base_url, user_payload):
+    """Load test against the configured backend; only runs with --load-test."""
+    if not request.config.getoption("--load-test"):
+        pytest.skip("Load tests run only with --load-test")
+
+    api = ServiceAPI(token=auth_token, session=api_session)
+    result = LoadTest(api, create_and_fetch_user(base_url, user_payload),
+                      concurrency=request.config.getoption("--load-concurrency"),
+                      rate=request.config.getoption("--load-rate")).run(
+        iterations=request.config.getoption("--load-iterations"))
+
+    attach_result(result, "create_and_fetch_user")
+    result.assert_error_rate(max_rate=0.01)
+    result.assert_percentile('create-user', 95, max_ms=2000)
+    result.assert_percentile('user-info', 95, max_ms=1000)
@@ -0,0 +1,69 @@
+import pytest
+
+from utils.service_api.RetryPolicy import RetryPolicy
+from utils.service_api.ServiceAPINew import ServiceAPI
+from utils.service_api.StubServer import StubServer
+
+
+def flaky(failures, status=503, headers=None):
+    """Route handler failing with status `failures` times before answering 200."""
+    calls = {'count': 0}
+
+    def handler(method, path, body):
+        calls['count'] += 1
+        if calls['count'] <= failures:
+            return status, {"error": "unavailable"}, headers or {}
+        return 200, {"ok": True}
+    handler.calls = calls
+    return handler
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Client whose retry policy has short waits and a fresh budget."""
+    monkeypatch.setattr(ServiceAPI, 'retry_policy', RetryPolicy(max_attempts=3, backoff=0.01, budget=3))
+    client = ServiceAPI(token="stub-token")
+    yield client
+    client.close()
+
+
+def test_get_is_retried_honouring_retry_after(api):
+    """A GET answered 503 with Retry-After is retried after the requested wait and then succeeds."""
+    handler = flaky(2, headers={'Retry-After': '0'})
+    with StubServer({('GET', '/user-info/1'): handler}) as server:
+        response = api.get_service_response(f"{server.url}/user-info/1")
+
+    api.validate_response(response, expected_status=200)
+    assert handler.calls['count'] == 3
+    assert ServiceAPI.retry_policy.stats.test['retries'] == 2
+
+
+def test_post_is_not_retried_by_default(api):
+    """POST is not idempotent, so a 503 is returned to the test without retrying."""
+    handler = flaky(1)
+    with StubServer({('POST', '/create-user'): handler}) as server:
+        response = api.post_service_response(f"{server.url}/create-user", {"email": "a@b.c"})
+
+    assert response.status_code == 503
+    assert handler.calls['count'] == 1
+
+
+def test_retry_budget_limits_retries_per_test(api):
+    """Once the test's retry budget is spent, failing responses are returned as they are."""
+    handler = flaky(10, status=502)
+    with StubServer({('GET', '/health'): handler}) as server:
+        first = api.get_service_response(f"{server.url}/health")
+        second = api.get_service_response(f"{server.url}/health")
+
+    assert (first.status_code, second.status_code) == (502, 502)
+    assert handler.calls['count'] == 5
+    assert ServiceAPI.retry_policy.stats.test['budget_exhausted']
+
+
+def test_retry_request_retries_until_200(api):
+    """retry_request keeps its contract: any method, any non-200 status, fails once attempts run out."""
+    handler = flaky(1, status=500)
+    with StubServer({('POST', '/create-user'): handler}) as server:
+        response = api.retry_request(f"{server.url}/create-user", payload={"email": "a@b.c"}, method="POST",
+                                     retries=2, delay=0.01)
+    assert response.status_code == 200
@@ -0,0 +1,29 @@
+from utils.service_api.SchemaRegistry import SchemaRegistry
+
+USER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "user_id": {"type": "integer", "minimum": 1},
+        "firstName": {"type": "string"},
+        "email": {"type": "string", "pattern": "^[^@]+@[^@]+$"},
+        "user_role_id": {"type": "integer", "enum": [1, 2, 3]},
+    },
+    "required": ["user_id", "firstName", "email", "user_role_id"],
+}
+
+
+def make_users(count):
+    return [{"user_id": index + 1, "firstName": f"user{index}", "email": f"user{index}@example.com",
+             "user_role_id": 2} for index in range(count)]
+
+
+def test_bulk_validation_reports_all_errors():
+    """Bulk mode returns every error of every invalid record in one pass."""
+    users = make_users(10)
+    users[2]['email'] = "not-an-email"
+    users[7]['user_role_id'] = 9
+    del users[7]['firstName']
+
+    errors = SchemaRegistry().validate_many(users, USER_SCHEMA)
+    assert sorted((index, error.validator) for index, error in errors) == \
+        [(2, 'pattern'), (7, 'enum'), (7, 'required')]
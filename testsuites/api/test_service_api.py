@@ -3,13 +3,12 @@ import os
 import uuid
 
 import pytest
-from utils.service_api.ServiceAPINew import ServiceAPI
 
 
 @pytest.fixture(scope="module")
-def api_setup(api_url, auth_token):
+def api_setup(api_client):
     """Fixture to set up the ServiceAPI client."""
-    return ServiceAPI(token=auth_token)
+    return api_client
 
 
 @pytest.fixture(scope="module")
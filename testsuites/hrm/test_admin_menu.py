@@ -0,0 +1,30 @@
+import json
+import logging
+
+import allure
+
+from Pages.HrmAdmin import HrmAdmin
+
+log = logging.getLogger(__name__)
+
+
+def load_test_data():
+    with open("config/test_data.json", "r") as file:
+        return json.load(file)
+
+
+@allure.feature("HRM Admin Tests")
+class TestAdminMenu:
+
+    @allure.title("Verify logged-in admin lands on the dashboard")
+    @allure.tag("Smoke")
+    def test_admin_is_logged_in(self, hrm_login):
+        with allure.step("Validating the dashboard URL"):
+            hrm_login.verify_current_url()
+
+    @allure.title("Verify admin menu lists all sections")
+    @allure.tag("Regression")
+    def test_admin_menu_options(self, hrm_login):
+        with allure.step("Opening Admin and reading its top bar menu"):
+            expected_menu = load_test_data()["admin_menu_list"]
+            HrmAdmin(hrm_login.driver).verify_admin_menu_option(expected_menu)
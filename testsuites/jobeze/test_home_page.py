@@ -19,6 +19,7 @@ class TestHomePage:
     def class_setup(self, browser):
         self.driver = browser
         self.home_page = HomePage(self.driver)
+        self.home_page.wait_until_ready()
         self.test_data = load_test_data()
 
     @allure.title("Verify Home link redirects to base URL")
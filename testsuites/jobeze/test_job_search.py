@@ -7,7 +7,6 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from Pages.JobezePGObject.HomePage import HomePage
 from webdriver import WebDriverHelperNew
-import time
 
 log = logging.getLogger(__name__)
 
@@ -24,6 +23,7 @@ class TestHomePage:
     def class_setup(self, browser):
         self.driver = browser
         self.home_page = HomePage(self.driver)
+        self.home_page.wait_until_ready()
         self.test_data = load_test_data()
         self.web_driver_functions = WebDriverHelperNew.WebDriverHelper(self.driver)
         self.wait = WebDriverWait(self.driver, 20)
@@ -68,14 +68,21 @@ class TestHomePage:
 
         # Step 3: Enter both skill and location
         with allure.step("Step 3: Enter both skill and location"):
-            self.web_driver_functions.enter_text(self.home_page.SKILL_TEXTBOx, "Python", "Re-entering skill")
-            self.web_driver_functions.enter_text(self.home_page.LOCATION_INPUT, "Alberta", "Re-entering location")
-            self.web_driver_functions.click_element(self.home_page.JOB_SEARCH_BUTTON, "Search with both")
-            time.sleep(10)
-
-            job_containers = self.wait.until(
-                EC.presence_of_all_elements_located((By.CLASS_NAME, "jbscroll"))
-            )
+            self.web_driver_functions.fill_form(
+                {self.home_page.SKILL_TEXTBOx: "Python", self.home_page.LOCATION_INPUT: "Alberta"},
+                submit=self.home_page.JOB_SEARCH_BUTTON, comment="job search with skill and location")
+            self.web_driver_functions.wait_for_app_settled(wait_time=10)
+
+            self.wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, "jbscroll")))
+
+            # Read every card's text and skills in a single browser round trip
+            job_containers = self.web_driver_functions.extract_elements((By.CLASS_NAME, "jbscroll"), {
+                'card': {'locator': (By.XPATH, ".//div[contains(@class, 'card') and contains(@class, 'mb-3')]"),
+                         'field': 'text'},
+                'skills': {'locator': (By.XPATH, ".//div[contains(@class, 'MuiStack-root') and "
+                                                 "contains(@class, 'css-1rkgh5')]//span"),
+                           'field': 'text', 'all': True},
+            })
 
             assert len(job_containers) >= 2, "Expected at least two jbscroll containers"
 
@@ -83,15 +90,11 @@ class TestHomePage:
                 log.info(f"------ Inspecting Card {index + 1} ------")
 
                 # Get the card inside the container
-                try:
-                    card = container.find_element(
-                        By.XPATH, ".//div[contains(@class, 'card') and contains(@class, 'mb-3')]"
-                    )
-                except Exception as e:
-                    log.error(f"Card not found in container {index + 1}: {str(e)}")
+                if container['card'] is None:
+                    log.error(f"Card not found in container {index + 1}")
                     continue
 
-                card_text = card.text.lower()
+                card_text = container['card'].lower()
 
                 if index == 0:
                     # Validate location in card 1
@@ -100,8 +103,6 @@ class TestHomePage:
 
                 elif index == 1:
                     # Validate skill in card 2
-                    skill_xpath = ".//div[contains(@class, 'MuiStack-root') and contains(@class, 'css-1rkgh5')]//span"
-                    skill_elements = container.find_elements(By.XPATH, skill_xpath)
-                    skills = [el.text.strip().lower() for el in skill_elements if el.text.strip()]
+                    skills = [skill.strip().lower() for skill in container['skills'] if skill.strip()]
                     log.info(f"Card 2 skills: {skills}")
                     assert "python" in skills, "Card 2 does not contain skill 'Python'"
@@ -0,0 +1,43 @@
+import json
+import time
+import logging
+
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from webdriver.WebDriverHelperNew import WebDriverHelper
+
+log = logging.getLogger(__name__)
+
+CHECKS = 5
+MISSING_LOCATOR = (By.XPATH, "//*[@data-benchmark='does-not-exist']")
+
+
+@pytest.mark.performance
+@pytest.mark.fresh_browser
+@allure.feature("Performance Benchmarks")
+@allure.title("Compare absence checks with a 5s implicit wait and in zero-implicit-wait mode")
+def test_absence_check_time(browser):
+    """Times absence checks through find_elements under a 5s implicit wait and through the helper with none."""
+    helper = WebDriverHelper(browser)
+    results = {}
+
+    with allure.step("find_elements with a 5 second implicit wait"):
+        browser.implicitly_wait(5)
+        start = time.perf_counter()
+        for _ in range(CHECKS):
+            assert len(browser.find_elements(*MISSING_LOCATOR)) == 0
+        results['implicit_wait_5s'] = time.perf_counter() - start
+
+    with allure.step("does_element_exist with implicit wait disabled"):
+        browser.implicitly_wait(0)
+        start = time.perf_counter()
+        for _ in range(CHECKS):
+            assert not helper.does_element_exist(MISSING_LOCATOR)
+        results['implicit_wait_0s'] = time.perf_counter() - start
+
+    log.info(f"{CHECKS} absence checks: {results}")
+    allure.attach(json.dumps(results, indent=2), name="Absence check time (s)",
+                  attachment_type=allure.attachment_type.JSON)
+    assert results['implicit_wait_0s'] < results['implicit_wait_5s']
@@ -0,0 +1,41 @@
+import json
+import time
+import logging
+
+import allure
+import pytest
+import requests
+
+from utils.service_api.ServiceAPINew import ServiceAPI
+from utils.service_api.StubServer import StubServer
+
+log = logging.getLogger(__name__)
+
+REQUESTS = 300
+
+
+def requests_per_second(send, url):
+    start = time.perf_counter()
+    for index in range(REQUESTS):
+        assert send(f"{url}/user-info/{index}").status_code == 200
+    return REQUESTS / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+@allure.feature("Performance Benchmarks")
+@allure.title("Compare requests/sec of per-call connections and the pooled keep-alive session")
+def test_api_session_throughput():
+    """Sends GETs to a local stub server through module-level requests.get and through ServiceAPI's pooled session."""
+    api = ServiceAPI(token="benchmark-token")
+    with StubServer() as server:
+        results = {
+            'per_call_connection_rps': requests_per_second(
+                lambda url: requests.get(url, headers=api.get_headers()), server.url),
+            'pooled_session_rps': requests_per_second(api.get_service_response, server.url),
+        }
+    api.close()
+
+    log.info(f"API throughput: {results}")
+    allure.attach(json.dumps(results, indent=2), name="API requests per second",
+                  attachment_type=allure.attachment_type.JSON)
+    assert results['pooled_session_rps'] > results['per_call_connection_rps']
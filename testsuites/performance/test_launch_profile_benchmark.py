@@ -0,0 +1,54 @@
+import json
+import logging
+import statistics
+
+import allure
+import pytest
+
+from webdriver.LaunchBrowserNew import LaunchBrowser
+
+log = logging.getLogger(__name__)
+
+NAVIGATIONS = 3
+
+NAVIGATION_TIMING_SCRIPT = """
+var entry = performance.getEntriesByType('navigation')[0];
+return {domContentLoaded: entry.domContentLoadedEventEnd, load: entry.loadEventEnd};
+"""
+
+
+def measure_page_ready(request, env_url, profile):
+    host = request.config.getoption("--host")
+    browser_type = request.config.getoption("--browser") or "chrome"
+    headless = request.config.getoption("--headless")
+
+    driver = LaunchBrowser(profile=profile).launch_browser(host=host, browser=browser_type, headless=headless)
+    timings = []
+    try:
+        for _ in range(NAVIGATIONS):
+            driver.get("about:blank")
+            driver.get(env_url)
+            timings.append(driver.execute_script(NAVIGATION_TIMING_SCRIPT))
+    finally:
+        driver.quit()
+
+    return {
+        'domContentLoaded_ms': statistics.median(t['domContentLoaded'] for t in timings),
+        'load_ms': statistics.median(t['load'] for t in timings),
+    }
+
+
+@pytest.mark.performance
+@allure.feature("Performance Benchmarks")
+@allure.title("Compare page-ready time of the default and fast browser profiles")
+def test_fast_profile_page_ready_time(request, env_url):
+    """Loads the home page with both launch profiles and reports the median page-ready times."""
+    results = {}
+    for profile in ('default', 'fast'):
+        with allure.step(f"Measure page-ready time with the {profile} profile"):
+            results[profile] = measure_page_ready(request, env_url, profile)
+            log.info(f"{profile} profile: {results[profile]}")
+
+    allure.attach(json.dumps(results, indent=2), name="Page-ready time by profile",
+                  attachment_type=allure.attachment_type.JSON)
+    assert all(result['load_ms'] > 0 for result in results.values()), "Navigation timing not recorded"
@@ -0,0 +1,75 @@
+import json
+import timeit
+import logging
+
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from webdriver.Locators import parse_find_args
+
+log = logging.getLogger(__name__)
+
+CALLS = 100000
+# Every legacy strategy name, so the ladder is measured across its early and late branches
+LEGACY_CALLS = [
+    ('xpath', "//input[@name='username']", 10),
+    ('id', 'username', 10),
+    ('css', 'input.username', ''),
+    ('classname', 'username', ''),
+    ('tagname', 'input', 10),
+    ('linktext', 'Login', 10),
+    ('partiallinktext', 'Log', ''),
+    ('name', 'username', 10),
+]
+
+
+def if_elif_dispatch(locator, value, wait_time):
+    """Strategy resolution as the if/elif ladder of the old WebDriverHelper.find_element did it."""
+    wait_time = wait_time or 30
+    if locator == 'xpath':
+        return (By.XPATH, value), wait_time
+    elif locator == 'id':
+        return (By.ID, value), wait_time
+    elif locator == 'css':
+        return (By.CSS_SELECTOR, value), wait_time
+    elif locator == 'classname':
+        return (By.CLASS_NAME, value), wait_time
+    elif locator == 'tagname':
+        return (By.TAG_NAME, value), wait_time
+    elif locator == 'linktext':
+        return (By.LINK_TEXT, value), wait_time
+    elif locator == 'partiallinktext':
+        return (By.PARTIAL_LINK_TEXT, value), wait_time
+    elif locator == 'name':
+        return (By.NAME, value), wait_time
+
+
+def table_dispatch(locator, value, wait_time):
+    return parse_find_args(locator, (value, wait_time))
+
+
+def time_per_call_us(dispatch):
+    def run():
+        for call in LEGACY_CALLS:
+            dispatch(*call)
+    repeats = CALLS // len(LEGACY_CALLS)
+    return min(timeit.repeat(run, number=repeats, repeat=5)) / (repeats * len(LEGACY_CALLS)) * 1e6
+
+
+@pytest.mark.performance
+@allure.feature("Performance Benchmarks")
+@allure.title("Compare locator resolution through the if/elif ladder and the strategy table")
+def test_locator_dispatch_time():
+    """Resolves legacy (strategy, value, wait_time) arguments both ways and reports the cost per call."""
+    for call in LEGACY_CALLS:
+        assert table_dispatch(*call) == if_elif_dispatch(*call)
+
+    results = {
+        'if_elif_us_per_call': time_per_call_us(if_elif_dispatch),
+        'table_us_per_call': time_per_call_us(table_dispatch),
+    }
+
+    log.info(f"Locator dispatch: {results}")
+    allure.attach(json.dumps(results, indent=2), name="Locator dispatch time",
+                  attachment_type=allure.attachment_type.JSON)
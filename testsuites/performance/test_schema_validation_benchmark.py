@@ -0,0 +1,64 @@
+import json
+import time
+import logging
+
+import allure
+import pytest
+from jsonschema import validate
+
+from utils.service_api.SchemaRegistry import SchemaRegistry
+
+log = logging.getLogger(__name__)
+
+RECORDS = 1000
+
+USER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "user_id": {"type": "integer", "minimum": 1},
+        "firstName": {"type": "string"},
+        "lastName": {"type": "string"},
+        "email": {"type": "string", "pattern": "^[^@]+@[^@]+$"},
+        "user_role_id": {"type": "integer", "enum": [1, 2, 3]},
+        "companiesList": {"type": "array", "items": {"type": "integer"}},
+    },
+    "required": ["user_id", "firstName", "email", "user_role_id"],
+}
+
+
+def make_users(count):
+    return [{"user_id": index + 1, "firstName": f"user{index}", "lastName": "", "email": f"user{index}@example.com",
+             "user_role_id": 2, "companiesList": [-100, 379]} for index in range(count)]
+
+
+def per_record_us(validate_record, users):
+    start = time.perf_counter()
+    for user in users:
+        validate_record(user)
+    return (time.perf_counter() - start) / len(users) * 1e6
+
+
+@pytest.mark.performance
+@allure.feature("Performance Benchmarks")
+@allure.title("Compare per-record cost of jsonschema.validate and compiled, cached validators")
+def test_schema_validation_cost():
+    """Validates the same records with jsonschema.validate, the registry and the registry's bulk mode."""
+    users = make_users(RECORDS)
+    registry = SchemaRegistry()
+
+    results = {
+        'jsonschema_validate_us': per_record_us(lambda user: validate(instance=user, schema=USER_SCHEMA), users),
+        'registry_validate_us': per_record_us(lambda user: registry.validate(user, USER_SCHEMA), users),
+    }
+    start = time.perf_counter()
+    errors = registry.validate_many(users, USER_SCHEMA)
+    results['registry_bulk_us'] = (time.perf_counter() - start) / RECORDS * 1e6
+    results['compiled_schemas'] = registry.stats['compiled']
+
+    log.info(f"Schema validation per record: {results}")
+    allure.attach(json.dumps(results, indent=2), name="Schema validation cost (us per record)",
+                  attachment_type=allure.attachment_type.JSON)
+    assert errors == []
+    assert registry.stats['compiled'] == 1
+    assert results['registry_bulk_us'] < results['jsonschema_validate_us']
+
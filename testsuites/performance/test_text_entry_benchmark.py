@@ -0,0 +1,54 @@
+import json
+import time
+import logging
+
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from webdriver.WebDriverHelperNew import WebDriverHelper
+
+log = logging.getLogger(__name__)
+
+LENGTHS = (10, 1000, 10000)
+TEXTAREA = (By.ID, "text-entry-benchmark")
+
+ADD_TEXTAREA_SCRIPT = """
+var old = document.getElementById('text-entry-benchmark');
+if (old) { old.remove(); }
+var el = document.createElement('textarea');
+el.id = 'text-entry-benchmark';
+document.body.prepend(el);
+"""
+
+
+def measure_entry(helper, text, key_events):
+    """Returns the seconds clear_and_enter_text takes and checks the value arrived intact."""
+    start = time.perf_counter()
+    helper.clear_and_enter_text(TEXTAREA, text, "benchmark textarea", key_events=key_events)
+    elapsed = time.perf_counter() - start
+    assert helper.get_element_attribute_value(TEXTAREA, "benchmark textarea") == text
+    return elapsed
+
+
+@pytest.mark.performance
+@allure.feature("Performance Benchmarks")
+@allure.title("Compare typed text entry with fast text entry for 10, 1k and 10k characters")
+def test_text_entry_time(browser):
+    """Times entering text of increasing length by typing it and through the native value setter."""
+    helper = WebDriverHelper(browser, fast_text_entry=True)
+    browser.execute_script(ADD_TEXTAREA_SCRIPT)
+    results = {}
+
+    for length in LENGTHS:
+        text = ("fast text entry " * (length // 16 + 1))[:length]
+        with allure.step(f"Enter {length} characters"):
+            results[length] = {
+                'typed_s': measure_entry(helper, text, key_events=True),
+                'fast_s': measure_entry(helper, text, key_events=False),
+            }
+
+    log.info(f"Text entry time: {results}")
+    allure.attach(json.dumps(results, indent=2), name="Text entry time (s)",
+                  attachment_type=allure.attachment_type.JSON)
+    assert results[10000]['fast_s'] < results[10000]['typed_s']
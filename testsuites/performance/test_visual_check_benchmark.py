@@ -0,0 +1,73 @@
+import json
+import time
+import logging
+
+import allure
+import cv2
+import numpy
+import pytest
+from skimage.metrics import structural_similarity
+
+from webdriver.VisualCheck import VisualComparator
+
+log = logging.getLogger(__name__)
+
+COMPARISONS = 300
+# Full-image SSIM is timed on a sample only, it is far too slow to run for every case
+FULL_SSIM_SAMPLE = 20
+WIDTH, HEIGHT = 1280, 800
+
+
+def make_page(seed):
+    """Draws a synthetic page of text-like blocks, so comparisons cost what real screenshots cost."""
+    rng = numpy.random.default_rng(seed)
+    image = numpy.full((HEIGHT, WIDTH), 255, numpy.uint8)
+    for _ in range(120):
+        x, y = int(rng.integers(0, WIDTH - 200)), int(rng.integers(0, HEIGHT - 20))
+        cv2.putText(image, "Job card text", (x, y + 15), cv2.FONT_HERSHEY_SIMPLEX, 0.5, 0, 1)
+    return image
+
+
+def encode(image):
+    return cv2.imencode('.png', image)[1].tobytes()
+
+
+@pytest.mark.performance
+@allure.feature("Performance Benchmarks")
+@allure.title("Time hundreds of visual comparisons with the prefilter against full-image SSIM")
+def test_visual_check_time(tmp_path):
+    """Runs a mix of identical, slightly changed and masked comparisons through the comparator and full SSIM."""
+    comparator = VisualComparator(baseline_dir=str(tmp_path / "baselines"), diff_dir=str(tmp_path / "diffs"))
+    baseline = make_page(0)
+    comparator.compare("page", encode(baseline))
+
+    changed = baseline.copy()
+    cv2.putText(changed, "Changed", (600, 400), cv2.FONT_HERSHEY_SIMPLEX, 0.5, 0, 1)
+    # Identical pages are the common case; every tenth one has a changed, unmasked label
+    cases = [(encode(changed), ()) if index % 10 == 0 else (encode(baseline), ()) for index in range(COMPARISONS)]
+    cases[1] = (encode(changed), ((580, 380, 120, 40),))
+
+    start = time.perf_counter()
+    outcomes = [comparator.compare("page", png, ignore)['passed'] for png, ignore in cases]
+    prefiltered_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for png, _ in cases[:FULL_SSIM_SAMPLE]:
+        actual = cv2.imdecode(numpy.frombuffer(png, numpy.uint8), cv2.IMREAD_GRAYSCALE)
+        structural_similarity(baseline, actual, data_range=255)
+    full_ssim_s = time.perf_counter() - start
+
+    results = {
+        'comparisons': COMPARISONS,
+        'prefiltered_total_s': prefiltered_s,
+        'prefiltered_ms_per_comparison': prefiltered_s / COMPARISONS * 1000,
+        'full_ssim_ms_per_comparison': full_ssim_s / FULL_SSIM_SAMPLE * 1000,
+        'stats': comparator.stats,
+    }
+    log.info(f"Visual check benchmark: {results}")
+    allure.attach(json.dumps(results, indent=2), name="Visual check time",
+                  attachment_type=allure.attachment_type.JSON)
+
+    assert outcomes[1], "Masked change should pass"
+    assert outcomes.count(False) == len(range(0, COMPARISONS, 10)), "Every unmasked change should fail"
+    assert results['prefiltered_ms_per_comparison'] < results['full_ssim_ms_per_comparison']
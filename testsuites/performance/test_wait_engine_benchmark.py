@@ -0,0 +1,77 @@
+import json
+import time
+import logging
+import statistics
+
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from webdriver.WaitEngine import WaitEngine
+
+log = logging.getLogger(__name__)
+
+ITERATIONS = 5
+APPEAR_AFTER_MS = 700
+LOCATOR = (By.ID, "wait-benchmark")
+
+SCHEDULE_ELEMENT_SCRIPT = """
+var old = document.getElementById('wait-benchmark');
+if (old) { old.remove(); }
+setTimeout(function () {
+    var el = document.createElement('div');
+    el.id = 'wait-benchmark';
+    el.textContent = 'ready';
+    document.body.appendChild(el);
+    window.waitBenchmarkInsertedAt = performance.now();
+}, arguments[0]);
+"""
+
+
+def one_way_ms(driver):
+    """Half the median round trip of a no-op script: the delay before a script starts in the browser."""
+    round_trips = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        driver.execute_script("return 0;")
+        round_trips.append((time.perf_counter() - start) * 1000)
+    return statistics.median(round_trips) / 2
+
+
+def measure_latency(driver, wait_for_element):
+    """
+    Returns the median ms between the element appearing and the wait returning.
+
+    Both timestamps are taken on the browser's clock, so the result also holds for a
+    remote browser: the script run right after the wait returns reads how long ago the
+    element was inserted, minus the one-way delay of getting that script to the browser.
+    """
+    delay = one_way_ms(driver)
+    latencies = []
+    for _ in range(ITERATIONS):
+        driver.execute_script(SCHEDULE_ELEMENT_SCRIPT, APPEAR_AFTER_MS)
+        wait_for_element()
+        since_inserted = driver.execute_script("return performance.now() - window.waitBenchmarkInsertedAt;")
+        latencies.append(since_inserted - delay)
+    return statistics.median(latencies)
+
+
+@pytest.mark.performance
+@allure.feature("Performance Benchmarks")
+@allure.title("Compare wait latency of the in-browser wait engine and WebDriverWait polling")
+def test_wait_engine_latency(browser):
+    """Measures how long after an element appears each wait implementation notices it."""
+    engine = WaitEngine(browser)
+    results = {
+        'webdriverwait_polling_ms': measure_latency(
+            browser, lambda: WebDriverWait(browser, 10).until(EC.visibility_of_element_located(LOCATOR))),
+        'mutation_observer_ms': measure_latency(
+            browser, lambda: engine.until('visible', LOCATOR, 10)),
+    }
+
+    log.info(f"Median wait latency: {results}")
+    allure.attach(json.dumps(results, indent=2), name="Wait latency",
+                  attachment_type=allure.attachment_type.JSON)
+    assert engine.scripts_supported, "In-browser waits fell back to polling"
@@ -0,0 +1,95 @@
+import pytest
+
+from webdriver.SessionSnapshot import SessionSnapshot
+
+ORIGIN = "https://hrm.test"
+LOGIN_URL = f"{ORIGIN}/web/index.php/auth/login"
+DASHBOARD_URL = f"{ORIGIN}/web/index.php/dashboard/index"
+
+
+class FakeDriver:
+    """CDP-capable driver stand-in whose server accepts only the session cookies listed in `accepted`."""
+
+    def __init__(self, accepted=()):
+        self.accepted = set(accepted)
+        self.cookies = {}
+        self.current_url = "about:blank"
+        self.cdp_commands = []
+        self.deleted_cookies = False
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_commands.append(cmd)
+        if cmd == "Network.setCookies":
+            self.cookies.update({cookie['name']: cookie['value'] for cookie in params['cookies']})
+        if cmd == "Page.addScriptToEvaluateOnNewDocument":
+            return {'identifier': '1'}
+        return {}
+
+    def get(self, url):
+        self.current_url = DASHBOARD_URL if self.cookies.get('orangehrm') in self.accepted else LOGIN_URL
+
+    def get_cookies(self):
+        return [{'name': name, 'value': value, 'domain': 'hrm.test', 'path': '/'}
+                for name, value in self.cookies.items()]
+
+    def execute_script(self, script, *args):
+        return {'origin': ORIGIN, 'local': {'theme': 'dark'}, 'session': {}}
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+        self.deleted_cookies = True
+
+    def is_logged_in(self):
+        return "/auth/login" not in self.current_url
+
+
+def ui_login_as(driver, session_id):
+    """UI login stand-in after which the server issues and accepts session_id."""
+    def login():
+        driver.accepted.add(session_id)
+        driver.cookies['orangehrm'] = session_id
+        driver.current_url = DASHBOARD_URL
+    return login
+
+
+@pytest.fixture
+def snapshots(tmp_path):
+    """Snapshot store holding a valid snapshot of the Admin role, captured from session 'stored'."""
+    store = SessionSnapshot(cache_dir=str(tmp_path))
+    driver = FakeDriver(accepted={'stored'})
+    driver.cookies['orangehrm'] = 'stored'
+    store.capture(driver, 'Admin')
+    return store
+
+
+def test_snapshot_is_injected_without_ui_login(snapshots):
+    """A stored snapshot is seeded through CDP before navigating, and the login form is never used."""
+    driver = FakeDriver(accepted={'stored'})
+
+    def fail_ui_login():
+        pytest.fail("UI login should not run when the snapshot is accepted")
+
+    snapshots.login(driver, 'Admin', LOGIN_URL, ui_login=fail_ui_login, is_logged_in=driver.is_logged_in)
+
+    assert driver.current_url == DASHBOARD_URL
+    assert driver.cdp_commands == ["Network.setCookies", "Page.addScriptToEvaluateOnNewDocument",
+                                   "Page.removeScriptToEvaluateOnNewDocument"]
+    assert snapshots.load('Admin')['cookies'][0]['value'] == 'stored'
+
+
+def test_rejected_snapshot_falls_back_to_ui_login(snapshots):
+    """When the server no longer accepts the stored session, it is discarded and replaced after a UI login."""
+    driver = FakeDriver()
+    snapshots.login(driver, 'Admin', LOGIN_URL, ui_login=ui_login_as(driver, 'fresh'),
+                    is_logged_in=driver.is_logged_in)
+
+    assert driver.deleted_cookies
+    assert driver.current_url == DASHBOARD_URL
+    assert driver.cookies == {'orangehrm': 'fresh'}
+    assert snapshots.load('Admin')['cookies'][0]['value'] == 'fresh'
+
+
+def test_expired_snapshot_is_not_loaded(tmp_path):
+    store = SessionSnapshot(cache_dir=str(tmp_path), ttl=0)
+    store.capture(FakeDriver(), 'Admin')
+    assert store.load('Admin') is None
@@ -0,0 +1,106 @@
+import os
+import json
+import logging
+import threading
+from collections import deque
+
+
+class _LazyBody:
+    """Formats and truncates a body only if the log record is actually emitted."""
+
+    def __init__(self, policy, content):
+        self.policy = policy
+        self.content = content
+
+    def __str__(self):
+        return self.policy.truncate(self.content)
+
+
+class ApiLogPolicy:
+    """
+    Decides how much of each API exchange ServiceAPI writes to the log.
+
+    Bodies are formatted lazily and capped at max_body_bytes, keeping the head and
+    the tail. sampling maps URL substrings to the fraction of responses whose body is
+    logged (status lines are always logged); the first matching pattern wins. With
+    full_bodies_on_failure, the last buffer_size responses are kept in memory so the
+    complete exchanges of a failing test can be written to a side file.
+    """
+
+    def __init__(self, max_body_bytes=2048, sampling=None, full_bodies_on_failure=True, buffer_size=50):
+        self.max_body_bytes = max_body_bytes
+        self.sampling = dict(sampling or {})
+        self.full_bodies_on_failure = full_bodies_on_failure
+        self._seen = {}
+        self._responses = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def parse_sampling(entries):
+        """Parse 'pattern=rate' entries, e.g. ['/user-info=0.1'], into a sampling dict."""
+        sampling = {}
+        for entry in entries:
+            pattern, _, rate = entry.strip().rpartition('=')
+            if pattern:
+                sampling[pattern] = float(rate)
+        return sampling
+
+    def truncate(self, content):
+        if content is None:
+            return ''
+        if isinstance(content, str):
+            content = content.encode('utf-8', 'replace')
+        elif not isinstance(content, bytes):
+            content = json.dumps(content, default=str).encode('utf-8')
+        if not self.max_body_bytes or len(content) <= self.max_body_bytes:
+            return content.decode('utf-8', 'replace')
+        half = self.max_body_bytes // 2
+        return (f"{content[:half].decode('utf-8', 'replace')}"
+                f" ...[{len(content) - 2 * half} bytes truncated]... "
+                f"{content[-half:].decode('utf-8', 'replace')}")
+
+    def body(self, content):
+        return _LazyBody(self, content)
+
+    def should_log_body(self, url):
+        pattern, rate = next(((pattern, rate) for pattern, rate in self.sampling.items() if pattern in url),
+                             (None, 1.0))
+        if rate >= 1:
+            return True
+        # Count per pattern, so URLs that differ only by an id (/user-info/<id>) share one sample
+        with self._lock:
+            seen = self._seen[pattern] = self._seen.get(pattern, 0) + 1
+        # Deterministic sampling: log the responses where the running rate crosses a whole number
+        return int(seen * rate) != int((seen - 1) * rate)
+
+    def log_request(self, logger, method, url, payload=None):
+        if payload is None:
+            logger.info('Sending %s request to %s', method, url)
+        else:
+            logger.info('Sending %s request to %s with payload: %s', method, url, self.body(payload))
+
+    def log_response(self, logger, response):
+        if self.full_bodies_on_failure:
+            self._responses.append(response)
+        logger.info('Response received: %s', response.status_code)
+        if logger.isEnabledFor(logging.INFO) and self.should_log_body(response.url):
+            logger.info('Response Content: %s', self.body(response.content))
+
+    def reset(self):
+        """Forget the buffered responses, e.g. when a test ends."""
+        self._responses.clear()
+
+    def write_full_exchanges(self, path):
+        """Write the complete buffered request/response pairs to path; returns the path or None."""
+        responses, self._responses = list(self._responses), deque(maxlen=self._responses.maxlen)
+        if not responses:
+            return None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for response in responses:
+                request = response.request
+                body = request.body.decode('utf-8', 'replace') if isinstance(request.body, bytes) else request.body
+                f.write(f"{request.method} {request.url}\n{dict(request.headers)}\n{body or ''}\n\n"
+                        f"{response.status_code} {response.reason} ({response.elapsed.total_seconds() * 1000:.0f} ms)\n"
+                        f"{dict(response.headers)}\n{response.text}\n{'=' * 80}\n")
+        return path
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+
+import allure
+import pytest
+import requests
+
+from utils.service_api.ServiceAPINew import ServiceAPI
+
+log = logging.getLogger(__name__)
+
+
+class AsyncServiceAPI(ServiceAPI):
+    """
+    asyncio variant of ServiceAPI for fan-out checks.
+
+    The request methods are coroutines with the same names and arguments as in
+    ServiceAPI; the response helpers (validate_response, validate_json_schema, ...)
+    are inherited and work on the returned requests.Response objects. Requests run
+    on worker threads over the pooled session, at most `concurrency` at a time.
+
+        api = AsyncServiceAPI(token=auth_token, concurrency=20)
+        responses = api.run(api.gather(*(api.get_service_response(f"{base_url}/user-info/{user_id}")
+                                         for user_id in user_ids)))
+    """
+
+    def __init__(self, token=None, session=None, concurrency=10):
+        super().__init__(token, session, pool_size=concurrency)
+        self.concurrency = concurrency
+        self._limit = None
+
+    @staticmethod
+    def run(awaitable):
+        """Run a coroutine to completion from synchronous code, e.g. a pytest test."""
+        async def _await():
+            return await awaitable
+        return asyncio.run(_await())
+
+    def _semaphore(self):
+        # A semaphore belongs to the event loop it was first used in; each asyncio.run gets its own
+        loop = asyncio.get_running_loop()
+        if self._limit is None or self._limit[0] is not loop:
+            self._limit = (loop, asyncio.Semaphore(self.concurrency))
+        return self._limit[1]
+
+    async def request(self, method, api_url, payload=None, headers=None):
+        """Send one request on a worker thread once a concurrency slot is free."""
+        headers = self.get_headers() if headers is None else headers
+        async with self._semaphore():
+            self.log_policy.log_request(log, method, api_url, payload)
+            try:
+                response = await asyncio.to_thread(
+                    self.retry_policy.execute, method,
+                    lambda: self.session.request(method, api_url, json=payload, headers=headers), api_url)
+            except requests.exceptions.RequestException as e:
+                log.error(f'Error while sending {method} request to {api_url}: {str(e)}')
+                pytest.fail(f"API {method} request failed: {e}")
+        self.log_policy.log_response(log, response)
+        return response
+
+    async def get_service_response(self, api_url):
+        return await self.request('GET', api_url)
+
+    async def post_service_response(self, api_url, payload):
+        return await self.request('POST', api_url, payload)
+
+    async def patch_service_response(self, api_url, payload):
+        return await self.request('PATCH', api_url, payload)
+
+    async def put_service_response(self, api_url, payload):
+        return await self.request('PUT', api_url, payload)
+
+    async def delete_service_response(self, api_url):
+        return await self.request('DELETE', api_url)
+
+    async def custom_headers_request(self, api_url, payload=None, headers=None, method="GET"):
+        if headers is not None:
+            headers = {**self.default_header_overrides(), **headers}
+        return await self.request(method, api_url, payload, headers)
+
+    async def gather(self, *requests_, return_exceptions=False):
+        """
+        Await a batch of request coroutines and return their responses in order.
+        The concurrency limit applies across the whole batch.
+        """
+        with allure.step(f"Sending {len(requests_)} API requests, {self.concurrency} at a time"):
+            return await asyncio.gather(*requests_, return_exceptions=return_exceptions)
@@ -0,0 +1,237 @@
+import os
+import json
+import math
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from utils.path_helper import get_project_root
+
+log = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram: values are counted in buckets whose width is
+    proportional to the value (significant_figures digits of precision), so memory
+    stays bounded whatever the number of samples while percentiles keep their precision.
+    """
+
+    def __init__(self, significant_figures=3):
+        self.significant_figures = significant_figures
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def _bucket(self, value):
+        if value <= 0:
+            return 0.0
+        exponent = math.floor(math.log10(value)) - self.significant_figures + 1
+        # The outer round drops float noise such as 33.300000000000004
+        return round(round(value / 10 ** exponent) * 10 ** exponent, max(0, -exponent))
+
+    def record(self, value):
+        bucket = self._bucket(value)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percent):
+        """Smallest recorded bucket value that percent of the samples are at or below."""
+        if not self.count:
+            return None
+        target = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return min(bucket, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count if self.count else None,
+            'min_ms': self.min,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max,
+        }
+
+
+class LoadRun:
+    """Handle passed to the scenario; records the latency and outcome of each request by step name."""
+
+    def __init__(self, load_test, iteration):
+        self.load_test = load_test
+        self.iteration = iteration
+
+    def request(self, step, method, url, payload=None, headers=None):
+        """
+        Send a request through the client's session and record it under step. Responses
+        with status >= 400 and connection errors count as errors; connection errors
+        are re-raised so the scenario stops this iteration.
+        """
+        api = self.load_test.api
+        start = time.perf_counter()
+        try:
+            response = api.session.request(method, url, json=payload,
+                                           headers=api.get_headers() if headers is None else headers)
+        except requests.exceptions.RequestException:
+            self.load_test.record(step, (time.perf_counter() - start) * 1000, error=True)
+            raise
+        self.load_test.record(step, (time.perf_counter() - start) * 1000, error=response.status_code >= 400)
+        return response
+
+
+class LoadTest:
+    """
+    Replays a scenario against ServiceAPI endpoints at a fixed concurrency, optionally
+    paced to a target rate of scenario iterations per second, and collects per-step
+    latency histograms, throughput and error rates.
+
+    The scenario is a callable(run, iteration) that sends its requests with run.request:
+
+        def create_and_fetch(run, iteration):
+            created = run.request('create-user', 'POST', f"{base_url}/create-user", payload)
+            user_id = created.json()['message']['user_id']
+            run.request('user-info', 'GET', f"{base_url}/user-info/{user_id}")
+
+        result = LoadTest(api, create_and_fetch, concurrency=10, rate=20).run(iterations=200)
+        result.assert_percentile('user-info', 95, max_ms=800)
+    """
+
+    def __init__(self, api, scenario, concurrency=10, rate=None):
+        self.api = api
+        self.scenario = scenario
+        self.concurrency = concurrency
+        self.rate = rate
+        self.histograms = {}
+        self.errors = {}
+        self.failed_iterations = 0
+        self._lock = threading.Lock()
+
+    def record(self, step, latency_ms, error=False):
+        with self._lock:
+            self.histograms.setdefault(step, LatencyHistogram()).record(latency_ms)
+            if error:
+                self.errors[step] = self.errors.get(step, 0) + 1
+
+    def _iterate(self, iteration, scheduled_at):
+        delay = scheduled_at - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            self.scenario(LoadRun(self, iteration), iteration)
+        except Exception as e:
+            log.warning(f"Load test iteration {iteration} failed: {e}")
+            with self._lock:
+                self.failed_iterations += 1
+
+    def run(self, iterations=None, duration=None):
+        """
+        Run the scenario `iterations` times, or repeatedly for `duration` seconds.
+
+        :return: LoadTestResult
+        """
+        if iterations is None and duration is None:
+            raise ValueError("Either iterations or duration is required")
+        log.info(f"Starting load test: concurrency {self.concurrency}, rate {self.rate or 'unpaced'}, "
+                 f"{iterations or 'unbounded'} iterations, {duration or 'unbounded'} s")
+
+        start = time.perf_counter()
+        interval = 1 / self.rate if self.rate else 0
+        iteration = 0
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='load') as executor:
+            pending = []
+            while iterations is None or iteration < iterations:
+                scheduled_at = start + iteration * interval
+                if duration is not None and scheduled_at - start >= duration:
+                    break
+                pending.append(executor.submit(self._iterate, iteration, scheduled_at))
+                iteration += 1
+                # Keep the queue short so a duration-bound run stops on time
+                if len(pending) >= self.concurrency * 2:
+                    pending.pop(0).result()
+                    if duration is not None and time.perf_counter() - start >= duration:
+                        break
+            for future in pending:
+                future.result()
+        elapsed = time.perf_counter() - start
+        return LoadTestResult(self, iteration, elapsed)
+
+
+class LoadTestResult:
+    """Summary of a load test run, with report writers and percentile assertions for pytest."""
+
+    def __init__(self, load_test, iterations, elapsed):
+        self.histograms = load_test.histograms
+        requests_sent = sum(histogram.count for histogram in self.histograms.values())
+        self.summary = {
+            'concurrency': load_test.concurrency,
+            'target_rate': load_test.rate,
+            'iterations': iterations,
+            'failed_iterations': load_test.failed_iterations,
+            'duration_s': elapsed,
+            'requests': requests_sent,
+            'throughput_rps': requests_sent / elapsed if elapsed else 0.0,
+            'steps': {},
+        }
+        for step, histogram in self.histograms.items():
+            errors = load_test.errors.get(step, 0)
+            self.summary['steps'][step] = dict(histogram.summary(), errors=errors,
+                                               error_rate=errors / histogram.count,
+                                               throughput_rps=histogram.count / elapsed if elapsed else 0.0)
+
+    def step(self, name):
+        try:
+            return self.summary['steps'][name]
+        except KeyError:
+            raise AssertionError(f"No requests were recorded for step '{name}'") from None
+
+    def assert_percentile(self, step, percent, max_ms):
+        self.step(step)
+        actual = self.histograms[step].percentile(percent)
+        assert actual <= max_ms, f"p{percent} of {step} is {actual:.0f} ms, above {max_ms} ms"
+
+    def assert_error_rate(self, step=None, max_rate=0.0):
+        steps = [step] if step else list(self.summary['steps'])
+        for name in steps:
+            rate = self.step(name)['error_rate']
+            assert rate <= max_rate, f"Error rate of {name} is {rate:.2%}, above {max_rate:.2%}"
+
+    def write(self, name, directory=None):
+        """Write the summary as JSON and HTML under testResults/LoadTests and return both paths."""
+        directory = directory or os.path.join(get_project_root(), 'testResults', 'LoadTests')
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f"{name}_{time.strftime('%Y-%m-%d_%H-%M-%S')}")
+        with open(f"{base}.json", 'w') as f:
+            json.dump(self.summary, f, indent=2)
+        with open(f"{base}.html", 'w') as f:
+            f.write(self.to_html(name))
+        return f"{base}.json", f"{base}.html"
+
+    def to_html(self, name):
+        def cell(value):
+            return f"{value:.1f}" if isinstance(value, float) else str(value)
+
+        columns = ('count', 'errors', 'error_rate', 'throughput_rps', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms',
+                   'max_ms')
+        rows = ''.join(f"<tr><td>{step}</td>{''.join(f'<td>{cell(values[column])}</td>' for column in columns)}</tr>"
+                       for step, values in self.summary['steps'].items())
+        return (f"<html><head><title>Load test: {name}</title></head><body>"
+                f"<h2>Load test: {name}</h2>"
+                f"<p>{self.summary['iterations']} iterations at concurrency {self.summary['concurrency']}, "
+                f"target rate {self.summary['target_rate'] or 'unpaced'}; {self.summary['requests']} requests in "
+                f"{self.summary['duration_s']:.1f} s ({self.summary['throughput_rps']:.1f} req/s), "
+                f"{self.summary['failed_iterations']} failed iterations</p>"
+                f"<table border='1'><tr><th>step</th>{''.join(f'<th>{column}</th>' for column in columns)}</tr>"
+                f"{rows}</table></body></html>")
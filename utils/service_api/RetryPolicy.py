@@ -0,0 +1,138 @@
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+import requests
+
+log = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'})
+ALL_METHODS = IDEMPOTENT_METHODS | {'POST', 'PATCH'}
+
+
+class RetryStats:
+    """Retry counters of the current test and of the session, shared by a policy and its variants."""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.test = {'retries': 0, 'wait_s': 0.0, 'budget_exhausted': False}
+        self.session = {'retries': 0, 'wait_s': 0.0, 'tests_with_retries': 0}
+        self.lock = threading.Lock()
+
+    def take(self, wait_s):
+        """Spend one retry of the test's budget; False when the budget is used up."""
+        with self.lock:
+            if self.budget is not None and self.test['retries'] >= self.budget:
+                self.test['budget_exhausted'] = True
+                return False
+            self.test['retries'] += 1
+            self.test['wait_s'] += wait_s
+            self.session['retries'] += 1
+            self.session['wait_s'] += wait_s
+            return True
+
+    def reset_test(self):
+        """Start the budget of a new test; returns the counters of the finished one."""
+        with self.lock:
+            finished = self.test
+            if finished['retries']:
+                self.session['tests_with_retries'] += 1
+            self.test = {'retries': 0, 'wait_s': 0.0, 'budget_exhausted': False}
+        return finished
+
+
+class RetryPolicy:
+    """
+    Decides whether and when ServiceAPI retries a request.
+
+    Retries connection errors, timeouts and the statuses in retry_statuses, only for
+    the methods in retry_methods (idempotent ones by default), up to max_attempts
+    attempts in total. Waits follow exponential backoff with full jitter; 429 and 503
+    responses with a Retry-After header wait as long as the server asks, unless that is
+    longer than max_retry_after, in which case the response is returned as is. Every
+    test gets a budget of retries across all requests, so a flaky backend cannot
+    stretch a test indefinitely.
+    """
+
+    def __init__(self, max_attempts=3, backoff=0.5, max_backoff=30, jitter=True,
+                 retry_statuses=(429, 502, 503, 504), retry_methods=IDEMPOTENT_METHODS,
+                 max_retry_after=60, budget=10, stats=None):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.max_retry_after = max_retry_after
+        self.stats = stats if stats is not None else RetryStats(budget)
+
+    def with_overrides(self, **overrides):
+        """A variant of this policy with some settings changed, sharing its budget and counters."""
+        settings = dict(max_attempts=self.max_attempts, backoff=self.backoff, max_backoff=self.max_backoff,
+                        jitter=self.jitter, retry_statuses=self.retry_statuses, retry_methods=self.retry_methods,
+                        max_retry_after=self.max_retry_after, stats=self.stats)
+        settings.update(overrides)
+        return RetryPolicy(**settings)
+
+    def backoff_delay(self, attempt):
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def retry_after(response):
+        """Seconds the server asked to wait in Retry-After, or None."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def _delay_for(self, attempt, response):
+        if response is not None and response.status_code in (429, 503):
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+        return self.backoff_delay(attempt)
+
+    def execute(self, method, send, description=''):
+        """
+        Call send() until it returns a response that needs no retry, attempts or budget
+        run out, or it raises an error that is not retried.
+
+        :return: the last response; the last connection error is re-raised.
+        """
+        method = method.upper()
+        attempt = 1
+        while True:
+            response = error = None
+            try:
+                response = send()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+            if response is not None and response.status_code not in self.retry_statuses:
+                return response
+            if method not in self.retry_methods or attempt >= self.max_attempts:
+                break
+            delay = self._delay_for(attempt, response)
+            if delay is None or not self.stats.take(delay):
+                break
+            outcome = f"status {response.status_code}" if response is not None else type(error).__name__
+            log.warning(f"Retrying {method} {description} after {outcome}: attempt {attempt + 1} of "
+                        f"{self.max_attempts} in {delay:.2f}s")
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+        if error is not None:
+            raise error
+        return response
@@ -0,0 +1,61 @@
+import json
+import hashlib
+import logging
+import threading
+
+from jsonschema import validators
+from jsonschema.exceptions import best_match
+
+log = logging.getLogger(__name__)
+
+
+class SchemaRegistry:
+    """
+    Compiled JSON-schema validators keyed by a hash of the schema.
+
+    jsonschema.validate checks the schema against its metaschema and builds a new
+    validator on every call. The registry does both once per distinct schema and
+    reuses the validator for the rest of the session.
+    """
+
+    def __init__(self):
+        self._validators = {}
+        self._lock = threading.Lock()
+        self.stats = {'compiled': 0, 'reused': 0}
+
+    @staticmethod
+    def schema_key(schema):
+        canonical = json.dumps(schema, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def validator(self, schema):
+        """Return the compiled validator of schema, compiling it on first use."""
+        key = self.schema_key(schema)
+        validator = self._validators.get(key)
+        if validator is not None:
+            self.stats['reused'] += 1
+            return validator
+        cls = validators.validator_for(schema)
+        cls.check_schema(schema)
+        validator = cls(schema)
+        with self._lock:
+            self._validators.setdefault(key, validator)
+            self.stats['compiled'] += 1
+        log.debug(f"Compiled JSON schema {key[:12]} with {cls.__name__}")
+        return validator
+
+    def validate(self, instance, schema):
+        """Validate like jsonschema.validate: raise the most relevant ValidationError, if any."""
+        error = best_match(self.validator(schema).iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def validate_many(self, instances, schema):
+        """
+        Validate every record of instances against schema in one pass.
+
+        :return: list of (index, ValidationError) for all errors of all records; empty when valid.
+        """
+        validator = self.validator(schema)
+        return [(index, error) for index, instance in enumerate(instances)
+                for error in validator.iter_errors(instance)]
@@ -1,17 +1,54 @@
-import time
 import logging
 import allure
 import requests
 import pytest
-from jsonschema import validate, ValidationError
+from requests.adapters import HTTPAdapter
+
+from utils.service_api.ApiLogPolicy import ApiLogPolicy
+from utils.service_api.SchemaRegistry import SchemaRegistry
+from utils.service_api.RetryPolicy import RetryPolicy, ALL_METHODS
+from jsonschema import ValidationError
 
 log = logging.getLogger(__name__)  # Configure logging
 
 
 class ServiceAPI:
-    def __init__(self, token=None):
-        """Initialize the API client with an optional authorization token."""
+    # How much of each exchange is logged; configured from pytest.ini or the command line in conftest
+    log_policy = ApiLogPolicy()
+    # Schemas are compiled once per session and shared by all clients
+    schema_registry = SchemaRegistry()
+    # Retries of every request method; the per-test budget is reset by conftest
+    retry_policy = RetryPolicy()
+
+    def __init__(self, token=None, session=None, pool_size=10, keep_alive=True):
+        """
+        Initialize the API client with an optional authorization token.
+
+        Requests go through a pooled requests.Session so connections (and TLS handshakes)
+        are reused across calls. Pass a session to share one pool between clients, e.g.
+        the session-scoped api_session fixture; otherwise the client creates its own.
+        A shared session is left untouched: every request passes this client's headers.
+        """
         self.token = token
+        if session is None:
+            session = self.create_session(pool_size, keep_alive)
+            session.headers.update(self.get_headers())
+        self.session = session
+
+    @staticmethod
+    def create_session(pool_size=10, keep_alive=True):
+        """Create a requests.Session keeping up to pool_size connections per host alive."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def close(self):
+        """Close the pooled connections of the session."""
+        self.session.close()
 
     def get_headers(self):
         """Construct the headers, including the authorization token if provided."""
@@ -22,16 +59,19 @@ class ServiceAPI:
             headers['Authorization'] = f'Bearer {self.token}'  # Include token in the Authorization header
         return headers
 
+    def default_header_overrides(self):
+        """None for every default header a session may carry, so requests.Session drops them."""
+        return dict.fromkeys(['Authorization', *self.get_headers()])
+
     @allure.step("Sending GET request to API")
     def get_service_response(self, api_url):
         """Send GET request to the given API URL with optional authorization and return the response."""
-        log.info(f'Sending GET request to {api_url}')
+        self.log_policy.log_request(log, 'GET', api_url)
         try:
             headers = self.get_headers()
-            response = requests.get(api_url, headers=headers)
-            log.info(f'Response received: {response.status_code}')
-            # Log the response content
-            log.info(f'Response Content:, {response.text}')
+            response = self.retry_policy.execute(
+                'GET', lambda: self.session.get(api_url, headers=headers), api_url)
+            self.log_policy.log_response(log, response)
             return response
         except requests.exceptions.RequestException as e:
             log.error(f'Error while sending GET request to {api_url}: {str(e)}')
@@ -40,13 +80,12 @@ class ServiceAPI:
     @allure.step("Sending POST request to API")
     def post_service_response(self, api_url, payload):
         """Send POST request to the given API URL with payload and optional authorization."""
-        log.info(f'Sending POST request to {api_url} with payload: {payload}')
+        self.log_policy.log_request(log, 'POST', api_url, payload)
         try:
             headers = self.get_headers()
-            response = requests.post(api_url, json=payload, headers=headers)
-            log.info(f'Response received: {response.status_code}')
-            # Log the response content
-            log.info(f'Response Content:, {response.text}')
+            response = self.retry_policy.execute(
+                'POST', lambda: self.session.post(api_url, json=payload, headers=headers), api_url)
+            self.log_policy.log_response(log, response)
             return response
         except requests.exceptions.RequestException as e:
             log.error(f'Error while sending POST request to {api_url}: {str(e)}')
@@ -55,13 +94,12 @@ class ServiceAPI:
     @allure.step("Sending PATCH request to API")
     def patch_service_response(self, api_url, payload):
         """Send PATCH request to the given API URL with payload and optional authorization."""
-        log.info(f'Sending PATCH request to {api_url} with payload: {payload}')
+        self.log_policy.log_request(log, 'PATCH', api_url, payload)
         try:
             headers = self.get_headers()
-            response = requests.patch(api_url, json=payload, headers=headers)
-            log.info(f'Response received: {response.status_code}')
-            # Log the response content
-            log.info(f'Response Content:, {response.text}')
+            response = self.retry_policy.execute(
+                'PATCH', lambda: self.session.patch(api_url, json=payload, headers=headers), api_url)
+            self.log_policy.log_response(log, response)
             return response
         except requests.exceptions.RequestException as e:
             log.error(f'Error while sending PATCH request to {api_url}: {str(e)}')
@@ -70,13 +108,12 @@ class ServiceAPI:
     @allure.step("Sending DELETE request to API")
     def delete_service_response(self, api_url):
         """Send DELETE request to the given API URL with optional authorization."""
-        log.info(f'Sending DELETE request to {api_url}')
+        self.log_policy.log_request(log, 'DELETE', api_url)
         try:
             headers = self.get_headers()
-            response = requests.delete(api_url, headers=headers)
-            log.info(f'Response received: {response.status_code}')
-            # Log the response content
-            log.info(f'Response Content:, {response.text}')
+            response = self.retry_policy.execute(
+                'DELETE', lambda: self.session.delete(api_url, headers=headers), api_url)
+            self.log_policy.log_response(log, response)
             return response
         except requests.exceptions.RequestException as e:
             log.error(f'Error while sending DELETE request to {api_url}: {str(e)}')
@@ -93,12 +130,12 @@ class ServiceAPI:
     @allure.step("Sending PUT request to API")
     def put_service_response(self, api_url, payload):
         """Send PUT request to the given API URL with payload and optional authorization."""
-        log.info(f'Sending PUT request to {api_url} with payload: {payload}')
+        self.log_policy.log_request(log, 'PUT', api_url, payload)
         try:
             headers = self.get_headers()
-            response = requests.put(api_url, json=payload, headers=headers)
-            log.info(f'Response received: {response.status_code}')
-            log.info(f'Response Content: {response.text}')
+            response = self.retry_policy.execute(
+                'PUT', lambda: self.session.put(api_url, json=payload, headers=headers), api_url)
+            self.log_policy.log_response(log, response)
             return response
         except requests.exceptions.RequestException as e:
             log.error(f'Error while sending PUT request to {api_url}: {str(e)}')
@@ -136,10 +173,14 @@ class ServiceAPI:
         try:
             if headers is None:
                 headers = self.get_headers()
-            log.info(f'Sending {method} request to {api_url} with headers: {headers} and payload: {payload}')
-            response = requests.request(method, api_url, json=payload, headers=headers)
-            log.info(f'Response received: {response.status_code}')
-            log.info(f'Response Content: {response.text}')
+            else:
+                # Send only the given headers, not the defaults of the pooled session
+                headers = {**self.default_header_overrides(), **headers}
+            log.info('Sending %s request to %s with headers: %s and payload: %s',
+                     method, api_url, headers, self.log_policy.body(payload))
+            response = self.retry_policy.execute(
+                method, lambda: self.session.request(method, api_url, json=payload, headers=headers), api_url)
+            self.log_policy.log_response(log, response)
             return response
         except requests.exceptions.RequestException as e:
             log.error(f'Error while sending {method} request to {api_url}: {str(e)}')
@@ -152,10 +193,10 @@ class ServiceAPI:
         log.info(f"Request URL: {response.request.url}")
         log.info(f"Request Headers: {response.request.headers}")
         if response.request.body:
-            log.info(f"Request Body: {response.request.body}")
+            log.info("Request Body: %s", self.log_policy.body(response.request.body))
         log.info(f"Response Status Code: {response.status_code}")
         log.info(f"Response Headers: {response.headers}")
-        log.info(f"Response Text: {response.text}")
+        log.info("Response Text: %s", self.log_policy.body(response.content))
 
     @allure.step("Validating content type in response header")
     def validate_content_type(self, response, expected_content_type="application/json"):
@@ -185,30 +226,55 @@ class ServiceAPI:
 
     @allure.step("Retrying request on failure")
     def retry_request(self, api_url, payload=None, method="GET", retries=3, delay=2):
-        """Retries the request on failure for a specified number of times with a delay."""
-        for attempt in range(retries):
-            try:
-                log.info(f"Attempt {attempt + 1} for {method} request to {api_url}")
-                response = self.custom_headers_request(api_url, payload=payload, method=method)
-                if response.status_code == 200:
-                    return response
-            except requests.exceptions.RequestException as e:
-                log.warning(f"Request attempt {attempt + 1} failed: {e}")
-                if attempt < retries - 1:
-                    time.sleep(delay)
-        pytest.fail(f"{method} request failed after {retries} retries")
+        """
+        Sends the request until it returns 200, retrying any method with exponential
+        backoff starting at delay seconds, within the test's retry budget.
+        """
+        policy = self.retry_policy.with_overrides(
+            max_attempts=retries, backoff=delay, retry_methods=ALL_METHODS,
+            retry_statuses={status for status in range(100, 600) if status != 200})
+        self.log_policy.log_request(log, method, api_url, payload)
+        try:
+            response = policy.execute(
+                method, lambda: self.session.request(method, api_url, json=payload, headers=self.get_headers()),
+                api_url)
+        except requests.exceptions.RequestException as e:
+            pytest.fail(f"{method} request failed after {retries} attempts: {e}")
+        self.log_policy.log_response(log, response)
+        if response.status_code != 200:
+            pytest.fail(f"{method} request failed after {retries} attempts with status {response.status_code}")
+        return response
 
     @allure.step("Validating response schema")
     def validate_json_schema(self, response, schema):
         """Validates the response JSON against a provided schema."""
         try:
             json_data = self.get_json_response(response)
-            validate(instance=json_data, schema=schema)
+            self.schema_registry.validate(json_data, schema)
             log.info("JSON schema validation successful")
         except ValidationError as e:
             log.error(f"JSON schema validation failed: {e}")
             pytest.fail(f"JSON schema validation failed: {e}")
 
+    @allure.step("Validating every record of the response against a schema")
+    def validate_json_schema_bulk(self, response, schema, key=None, max_reported=20):
+        """
+        Validates each record of a JSON array (the whole response, or response[key]) against
+        the record schema in one pass, and fails listing all errors instead of the first one.
+        """
+        json_data = self.get_json_response(response)
+        records = json_data[key] if key is not None else json_data
+        assert isinstance(records, list), f"Expected a JSON array of records, got {type(records).__name__}"
+        errors = self.schema_registry.validate_many(records, schema)
+        if errors:
+            details = '\n'.join(f"record {index} at {'/'.join(map(str, error.absolute_path)) or '<root>'}: "
+                                 f"{error.message}" for index, error in errors[:max_reported])
+            more = f"\n... and {len(errors) - max_reported} more" if len(errors) > max_reported else ''
+            log.error(f"JSON schema validation failed for {len({index for index, _ in errors})} of "
+                      f"{len(records)} records")
+            pytest.fail(f"JSON schema validation failed with {len(errors)} errors:\n{details}{more}")
+        log.info(f"JSON schema validation successful for {len(records)} records")
+
     @allure.step("Calculating response size in bytes")
     def get_response_size(self, response):
         """Calculates and logs the size of the response in bytes."""
@@ -0,0 +1,88 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubServer:
+    """
+    In-process HTTP server for exercising the API clients offline.
+
+    Routes map (method, path) to a response tuple (status, json_body[, headers]) or to a
+    callable handler(method, path, body) returning one; a path ending in '/*' matches
+    any path with that prefix. Unrouted requests get 200 with the method and path echoed
+    back. Connections are kept alive (HTTP/1.1), like the real backend.
+
+        with StubServer({('GET', '/user-info/*'): (200, {'id': 1})}) as server:
+            requests.get(f"{server.url}/user-info/1")
+    """
+
+    def __init__(self, routes=None, host='127.0.0.1', port=0):
+        self.routes = dict(routes or {})
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='stub-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def respond(self, method, path, body):
+        with self._lock:
+            self.requests += 1
+        route = self.routes.get((method, path))
+        if route is None:
+            route = next((handler for (route_method, route_path), handler in self.routes.items()
+                          if route_method == method and route_path.endswith('/*')
+                          and path.startswith(route_path[:-1])), None)
+        if route is None:
+            return 200, {'method': method, 'path': path}, {}
+        response = route(method, path, body) if callable(route) else route
+        return response if len(response) == 3 else (*response, {})
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out in separate writes; without this, keep-alive
+            # connections stall on Nagle's algorithm and delayed ACKs
+            disable_nagle_algorithm = True
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                body = json.loads(raw) if raw else None
+                status, payload, headers = stub.respond(self.command, self.path, body)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
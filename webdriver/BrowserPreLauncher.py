@@ -0,0 +1,95 @@
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+
+from webdriver.LaunchBrowserNew import LaunchBrowser
+
+log = logging.getLogger(__name__)
+
+
+class BrowserPreLauncher:
+    """
+    Starts browsers on a worker thread ahead of time so a test that needs a
+    new browser can take one that is already running.
+
+    At most ``max_prelaunched`` browsers are started speculatively; any that
+    are not handed over are quit by ``shutdown``.
+    """
+
+    def __init__(self, launcher=None, max_prelaunched=1):
+        self.launcher = launcher or LaunchBrowser()
+        self.max_prelaunched = max_prelaunched
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_prelaunched, thread_name_prefix='browser-prelaunch')
+        self.handed_over = 0
+        self.launch_seconds = 0.0
+        self.hidden_seconds = 0.0
+
+    @staticmethod
+    def make_key(host, browser, headless):
+        return browser.lower(), bool(headless), host
+
+    def prelaunch(self, host, browser="chrome", headless=False):
+        """Starts a browser in the background unless the pre-launch limit is reached."""
+        key = self.make_key(host, browser, headless)
+        with self._lock:
+            if sum(len(futures) for futures in self._pending.values()) >= self.max_prelaunched:
+                return False
+            future = self._executor.submit(self._timed_launch, host, browser, headless)
+            self._pending.setdefault(key, deque()).append(future)
+        log.info(f"Pre-launching {key[0]} browser in the background")
+        return True
+
+    def launch_browser(self, host, browser="chrome", headless=False):
+        """Hands over a pre-launched browser for the key, or launches one synchronously."""
+        key = self.make_key(host, browser, headless)
+        with self._lock:
+            futures = self._pending.get(key)
+            future = futures.popleft() if futures else None
+
+        if future is None:
+            return self.launcher.launch_browser(host=host, browser=browser, headless=headless)
+
+        wait_start = time.perf_counter()
+        try:
+            driver, launch_time = future.result()
+        except Exception as e:
+            log.warning(f"Pre-launched {key[0]} browser failed to start, launching synchronously: {e}")
+            return self.launcher.launch_browser(host=host, browser=browser, headless=headless)
+        waited = time.perf_counter() - wait_start
+
+        self.handed_over += 1
+        self.launch_seconds += launch_time
+        self.hidden_seconds += max(launch_time - waited, 0.0)
+        log.info(f"Handed over pre-launched {key[0]} browser, waited {waited:.2f}s of {launch_time:.2f}s launch")
+        return driver
+
+    def _timed_launch(self, host, browser, headless):
+        start = time.perf_counter()
+        driver = self.launcher.launch_browser(host=host, browser=browser, headless=headless)
+        return driver, time.perf_counter() - start
+
+    def summary(self):
+        return (f"{self.handed_over} pre-launched browsers handed over, "
+                f"{self.hidden_seconds:.2f}s of {self.launch_seconds:.2f}s launch latency hidden")
+
+    def shutdown(self):
+        """Waits for in-flight launches and quits every browser that was not handed over."""
+        with self._lock:
+            futures = [future for pending in self._pending.values() for future in pending]
+            self._pending.clear()
+        self._executor.shutdown(wait=True)
+        for future in futures:
+            if future.exception() is not None:
+                continue
+            driver, _ = future.result()
+            try:
+                driver.quit()
+            except WebDriverException as e:
+                log.warning(f"Error while quitting unused pre-launched browser: {e}")
+        log.info(f"Browser pre-launcher shut down, {len(futures)} unused browsers quit. {self.summary()}")
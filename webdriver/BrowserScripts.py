@@ -0,0 +1,359 @@
+# JavaScript snippets executed in the browser by WebDriverHelperNew.
+#
+# FIND_ELEMENTS_JS and IS_VISIBLE_JS define helper functions and are meant to
+# be prepended to a script body, so that a locator tuple (By.<strategy>, value)
+# can be resolved inside the page without extra WebDriver round trips.
+
+FIND_ELEMENTS_JS = """
+function findAll(by, value, root) {
+    root = root || document;
+    switch (by) {
+        case 'css selector':
+            return Array.prototype.slice.call(root.querySelectorAll(value));
+        case 'id':
+            return Array.prototype.slice.call(root.querySelectorAll('#' + CSS.escape(value)));
+        case 'name':
+            return Array.prototype.slice.call(root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case 'class name':
+            return Array.prototype.slice.call(root.querySelectorAll('.' + CSS.escape(value)));
+        case 'tag name':
+            return Array.prototype.slice.call(root.querySelectorAll(value));
+        case 'link text':
+        case 'partial link text':
+            return Array.prototype.filter.call(root.querySelectorAll('a'), function (a) {
+                var text = a.innerText.trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+        case 'xpath':
+            var result = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < result.snapshotLength; i++) {
+                nodes.push(result.snapshotItem(i));
+            }
+            return nodes;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+"""
+
+IS_VISIBLE_JS = """
+function isVisible(el) {
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) {
+        return false;
+    }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+}
+"""
+
+COUNT_ELEMENTS_JS = FIND_ELEMENTS_JS + """
+return findAll(arguments[0], arguments[1]).length;
+"""
+
+PAGE_READY_JS = FIND_ELEMENTS_JS + IS_VISIBLE_JS + """
+var locators = arguments[0], predicate = arguments[1];
+if (document.readyState === 'loading') {
+    return false;
+}
+for (var i = 0; i < locators.length; i++) {
+    if (!findAll(locators[i][0], locators[i][1]).some(isVisible)) {
+        return false;
+    }
+}
+return predicate ? !!(new Function('return (' + predicate + ');'))() : true;
+"""
+
+EXTRACT_ELEMENTS_JS = FIND_ELEMENTS_JS + """
+function readField(el, spec) {
+    if (spec === 'text') {
+        return el.innerText.trim();
+    }
+    var separator = spec.indexOf(':');
+    var kind = spec.slice(0, separator), name = spec.slice(separator + 1);
+    switch (kind) {
+        case 'attr':
+            return el.getAttribute(name);
+        case 'prop':
+            return el[name];
+        case 'css':
+            return window.getComputedStyle(el).getPropertyValue(name);
+    }
+    throw new Error('Unsupported field spec: ' + spec);
+}
+function readSpec(el, spec) {
+    if (typeof spec === 'string') {
+        return readField(el, spec);
+    }
+    var children = findAll(spec.locator[0], spec.locator[1], el);
+    var field = spec.field || 'text';
+    if (spec.all) {
+        return children.map(function (child) { return readField(child, field); });
+    }
+    return children.length ? readField(children[0], field) : null;
+}
+var fields = arguments[2];
+return findAll(arguments[0], arguments[1]).map(function (el) {
+    var row = {};
+    Object.keys(fields).forEach(function (key) { row[key] = readSpec(el, fields[key]); });
+    return row;
+});
+"""
+
+WAIT_FOR_CONDITION_JS = FIND_ELEMENTS_JS + IS_VISIBLE_JS + """
+var by = arguments[0], value = arguments[1], condition = arguments[2], expected = arguments[3],
+    attribute = arguments[4], timeout = arguments[5], done = arguments[arguments.length - 1];
+
+function readAttribute(el) {
+    var property = el[attribute];
+    var actual = (property === undefined || property === null || typeof property === 'object')
+        ? el.getAttribute(attribute) : property;
+    return actual === null ? null : String(actual);
+}
+
+function check() {
+    var elements = findAll(by, value);
+    switch (condition) {
+        case 'presence':
+            return elements[0] || null;
+        case 'visible':
+            return elements.filter(isVisible)[0] || null;
+        case 'clickable':
+            return elements.filter(function (el) { return isVisible(el) && !el.disabled; })[0] || null;
+        case 'selected':
+            return elements[0] && (elements[0].selected || elements[0].checked) ? elements[0] : null;
+        case 'text':
+            return elements[0] && elements[0].innerText.indexOf(expected) !== -1;
+        case 'attribute':
+            return elements[0] && readAttribute(elements[0]) === expected;
+        case 'invisible':
+            return !elements.some(isVisible);
+    }
+    throw new Error('Unsupported wait condition: ' + condition);
+}
+
+var settled = false, observer = null, interval = null, timer = null;
+function finish(result) {
+    if (settled) {
+        return;
+    }
+    settled = true;
+    if (observer) { observer.disconnect(); }
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+}
+function evaluate() {
+    var result;
+    try {
+        result = check();
+    } catch (e) {
+        finish({error: String(e)});
+        return;
+    }
+    if (result) {
+        finish({met: true, value: result === true ? null : result, url: window.location.href});
+    }
+}
+
+evaluate();
+if (!settled) {
+    var scheduled = false;
+    observer = new MutationObserver(function () {
+        // Coalesce bursts of mutations into one check per microtask
+        if (!scheduled) {
+            scheduled = true;
+            Promise.resolve().then(function () { scheduled = false; evaluate(); });
+        }
+    });
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    // Style changes from stylesheets, transitions or element properties do not always mutate the DOM
+    interval = setInterval(evaluate, 100);
+    timer = setTimeout(function () { finish({met: false}); }, timeout);
+}
+"""
+
+# Counts in-flight fetch/XHR requests and records the time of the last network
+# and DOM activity in window.networkActivityTracker. Safe to run more than once.
+NETWORK_TRACKER_JS = """
+(function () {
+    if (window.networkActivityTracker) {
+        return;
+    }
+    var tracker = window.networkActivityTracker = {
+        inFlight: 0, lastNetwork: performance.now(), lastMutation: performance.now()
+    };
+    function started() {
+        tracker.inFlight++;
+        tracker.lastNetwork = performance.now();
+    }
+    function finished() {
+        tracker.inFlight = Math.max(0, tracker.inFlight - 1);
+        tracker.lastNetwork = performance.now();
+    }
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            started();
+            return originalFetch.apply(this, arguments).then(
+                function (response) { finished(); return response; },
+                function (error) { finished(); throw error; });
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        started();
+        this.addEventListener('loadend', finished);
+        return originalSend.apply(this, arguments);
+    };
+    if (window.PerformanceObserver) {
+        try {
+            // Scripts, images and other subresources are not fetch/XHR but still count as activity
+            new PerformanceObserver(function () { tracker.lastNetwork = performance.now(); })
+                .observe({type: 'resource'});
+        } catch (e) {
+        }
+    }
+    new MutationObserver(function () { tracker.lastMutation = performance.now(); })
+        .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+})();
+"""
+
+WAIT_FOR_QUIET_JS = NETWORK_TRACKER_JS + """
+var idleTime = arguments[0], watchDom = arguments[1], timeout = arguments[2],
+    done = arguments[arguments.length - 1];
+var tracker = window.networkActivityTracker, start = performance.now();
+var interval = setInterval(function () {
+    var now = performance.now();
+    var lastActivity = watchDom ? Math.max(tracker.lastNetwork, tracker.lastMutation) : tracker.lastNetwork;
+    if (document.readyState !== 'loading' && tracker.inFlight === 0 && now - lastActivity >= idleTime) {
+        clearInterval(interval);
+        done({met: true});
+    } else if (now - start >= timeout) {
+        clearInterval(interval);
+        done({met: false, inFlight: tracker.inFlight});
+    }
+}, 50);
+"""
+
+# Sets values through the native property setters, so frameworks that track the
+# DOM value (React, Vue, MUI) see the change, and fires the events they listen to.
+SET_VALUE_JS = """
+function nativeSetValue(el, value) {
+    var prototype = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(prototype, 'value').set.call(el, value);
+}
+function fireValueEvents(el) {
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+function setValue(el, value) {
+    el.focus();
+    if (el.type === 'checkbox' || el.type === 'radio') {
+        if (el.checked !== !!value) {
+            el.click();
+        }
+    } else {
+        nativeSetValue(el, value);
+        fireValueEvents(el);
+    }
+    el.blur();
+}
+"""
+
+# Whether a text field has to be typed into key by key: autocompletes, masks and
+# maxlength react to individual key presses, not to a value set in one go.
+NEEDS_KEY_EVENTS_JS = """
+function needsKeyEvents(el, text) {
+    if (el.tagName !== 'TEXTAREA' && (el.tagName !== 'INPUT' ||
+            ['text', 'search', 'email', 'url', 'tel', 'password', 'number'].indexOf(el.type) === -1)) {
+        return true;
+    }
+    return el.getAttribute('role') === 'combobox' || el.hasAttribute('aria-autocomplete') ||
+        el.hasAttribute('list') || el.hasAttribute('data-key-events') ||
+        (el.maxLength >= 0 && text.length > el.maxLength);
+}
+"""
+
+# Returns {missing, keyEvents}: the indices of the fields that are not visible yet
+# (-1 for the submit control), in which case nothing is filled, and the indices of
+# the text fields that need key events. The other fields are set, and submit is
+# clicked only when no field is left to type.
+FILL_FORM_JS = FIND_ELEMENTS_JS + IS_VISIBLE_JS + SET_VALUE_JS + NEEDS_KEY_EVENTS_JS + """
+var fields = arguments[0], submit = arguments[1];
+var elements = [], missing = [], keyEvents = [], button = null;
+fields.forEach(function (field, index) {
+    var el = findAll(field[0], field[1]).filter(isVisible)[0];
+    if (el) {
+        elements.push([el, field[2], index]);
+    } else {
+        missing.push(index);
+    }
+});
+if (submit) {
+    button = findAll(submit[0], submit[1]).filter(isVisible)[0];
+    if (!button) {
+        missing.push(-1);
+    }
+}
+// Nothing is filled until every field and the submit control are on the page
+if (missing.length) {
+    return {missing: missing, keyEvents: []};
+}
+elements.forEach(function (field) {
+    var el = field[0], value = field[1];
+    if (typeof value === 'string' && el.tagName !== 'SELECT' && needsKeyEvents(el, value)) {
+        keyEvents.push(field[2]);
+    } else {
+        setValue(el, value);
+    }
+});
+if (button && !keyEvents.length) {
+    button.click();
+}
+return {missing: [], keyEvents: keyEvents};
+"""
+
+# Sets the text of a single input in fast text entry mode. Returns false, with the
+# field holding its original value, when it needs real key events (autocompletes,
+# maxlength), when the browser sanitizes the value (checked before any event fires)
+# or when a listener rewrites it (input masks; the original value is then put back
+# with events so the page state matches the field again).
+SET_TEXT_JS = SET_VALUE_JS + NEEDS_KEY_EVENTS_JS + """
+var el = arguments[0], text = arguments[1];
+if (needsKeyEvents(el, text)) {
+    return false;
+}
+var original = el.value;
+el.focus();
+nativeSetValue(el, text);
+if (el.value !== text) {
+    nativeSetValue(el, original);
+    return false;
+}
+fireValueEvents(el);
+if (el.value !== text) {
+    nativeSetValue(el, original);
+    fireValueEvents(el);
+    return false;
+}
+el.blur();
+return true;
+"""
+
+# Viewport rectangles of every element matching the ignore locators, in device pixels
+# and relative to the origin element when one is given (element screenshots).
+IGNORE_REGIONS_JS = FIND_ELEMENTS_JS + """
+var locators = arguments[0], origin = arguments[1];
+var ratio = window.devicePixelRatio || 1;
+var base = origin ? origin.getBoundingClientRect() : {left: 0, top: 0};
+var regions = [];
+locators.forEach(function (locator) {
+    findAll(locator[0], locator[1]).forEach(function (el) {
+        var rect = el.getBoundingClientRect();
+        regions.push([Math.floor((rect.left - base.left) * ratio), Math.floor((rect.top - base.top) * ratio),
+                      Math.ceil(rect.width * ratio), Math.ceil(rect.height * ratio)]);
+    });
+});
+return regions;
+"""
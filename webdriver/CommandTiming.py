@@ -0,0 +1,110 @@
+import os
+import json
+import time
+import threading
+
+
+class TimedCommandExecutor:
+    """
+    Wraps a driver's command executor and records the name, duration and
+    payload sizes of every WebDriver command sent through it.
+    """
+
+    def __init__(self, executor):
+        self._executor = executor
+        self._records = []
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self._executor, name)
+
+    def execute(self, command, params):
+        start = time.perf_counter()
+        response = None
+        try:
+            response = self._executor.execute(command, params)
+            return response
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            record = {
+                'command': command,
+                'duration_ms': duration_ms,
+                'request_bytes': _payload_size(params),
+                'response_bytes': _payload_size(response.get('value')) if isinstance(response, dict) else 0,
+            }
+            with self._lock:
+                self._records.append(record)
+
+    def drain(self):
+        """Returns the commands recorded since the previous drain."""
+        with self._lock:
+            records, self._records = self._records, []
+        return records
+
+
+def _payload_size(payload):
+    if payload is None:
+        return 0
+    if isinstance(payload, str):
+        return len(payload)
+    try:
+        return len(json.dumps(payload))
+    except (TypeError, ValueError):
+        # Payloads holding WebElements or other objects only get an approximate size
+        return len(str(payload))
+
+
+def instrument(driver):
+    """Routes all commands of the driver through a TimedCommandExecutor."""
+    if not isinstance(driver.command_executor, TimedCommandExecutor):
+        driver.command_executor = TimedCommandExecutor(driver.command_executor)
+    return driver
+
+
+def drain_commands(driver):
+    """Returns the commands the driver sent since the last call, or [] when it is not instrumented."""
+    executor = getattr(driver, 'command_executor', None)
+    if isinstance(executor, TimedCommandExecutor):
+        return executor.drain()
+    return []
+
+
+def summarize_commands(records, top=5):
+    """Aggregates command records per command name, slowest total time first."""
+    per_command = {}
+    for record in records:
+        entry = per_command.setdefault(record['command'], {
+            'command': record['command'], 'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'bytes': 0})
+        entry['count'] += 1
+        entry['total_ms'] += record['duration_ms']
+        entry['max_ms'] = max(entry['max_ms'], record['duration_ms'])
+        entry['bytes'] += record['request_bytes'] + record['response_bytes']
+
+    commands = sorted(per_command.values(), key=lambda entry: entry['total_ms'], reverse=True)
+    for entry in commands:
+        entry['avg_ms'] = entry['total_ms'] / entry['count']
+    return {
+        'count': len(records),
+        'total_rpc_ms': sum(record['duration_ms'] for record in records),
+        'top_commands': commands[:top] if top else commands,
+    }
+
+
+class CommandTimingReport:
+    """Collects command records of the whole session and writes the aggregate as JSON."""
+
+    def __init__(self):
+        self.records = []
+        self.tests = {}
+
+    def add(self, nodeid, records):
+        self.records.extend(records)
+        self.tests[nodeid] = summarize_commands(records, top=0)
+
+    def write(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        path = os.path.join(directory, f"command_timing_{time.strftime('%Y-%m-%d_%H-%M-%S')}_{worker}.json")
+        with open(path, 'w') as f:
+            json.dump({'session': summarize_commands(self.records, top=0), 'tests': self.tests}, f, indent=2)
+        return path
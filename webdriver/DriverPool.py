@@ -0,0 +1,179 @@
+import logging
+import threading
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from webdriver.LaunchBrowserNew import LaunchBrowser
+
+log = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """
+    Keeps warm WebDriver instances keyed by (browser, headless, host) so that
+    tests can reuse an already started browser instead of launching a new one.
+    """
+
+    def __init__(self, launcher=None, max_uses=25):
+        """
+        :param launcher: Object exposing launch_browser(host, browser, headless).
+        :param max_uses: Number of tests a driver serves before it is recycled.
+        """
+        self.launcher = launcher or LaunchBrowser()
+        self.max_uses = max_uses
+        self._idle = {}
+        self._leased = {}
+        self._uses = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(host, browser, headless):
+        return browser.lower(), bool(headless), host
+
+    def acquire(self, host, browser="chrome", headless=False):
+        """Returns a healthy pooled driver for the key, launching one if none is idle."""
+        key = self.make_key(host, browser, headless)
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                driver = idle.pop() if idle else None
+            if driver is None:
+                break
+            if self.is_healthy(driver):
+                log.info(f"Reusing pooled {key[0]} driver ({self._uses[id(driver)]} previous tests)")
+                break
+            log.warning(f"Discarding unhealthy pooled {key[0]} driver")
+            self._discard(driver)
+
+        if driver is None:
+            driver = self.launcher.launch_browser(host=host, browser=browser, headless=headless)
+            self._uses[id(driver)] = 0
+
+        with self._lock:
+            self._leased[id(driver)] = key
+        return driver
+
+    def release(self, driver, reset=True):
+        """
+        Resets the driver and returns it to the pool, or quits it when it is worn out or unhealthy.
+
+        :param reset: Set to False when the test did not touch the default browser state,
+                      e.g. because it ran in its own browser context.
+        """
+        with self._lock:
+            key = self._leased.pop(id(driver), None)
+        if key is None:
+            log.warning("Released a driver that was not leased from the pool, quitting it")
+            self._quit(driver)
+            return
+
+        self._uses[id(driver)] += 1
+        if self._uses[id(driver)] >= self.max_uses:
+            log.info(f"Recycling {key[0]} driver after {self._uses[id(driver)]} tests")
+            self._discard(driver)
+            return
+
+        try:
+            if reset:
+                self.reset_state(driver)
+            elif not self.is_healthy(driver):
+                raise WebDriverException("driver stopped responding")
+        except WebDriverException as e:
+            log.warning(f"Failed to reset pooled driver, discarding it: {e}")
+            self._discard(driver)
+            return
+
+        with self._lock:
+            self._idle.setdefault(key, []).append(driver)
+
+    def will_recycle(self, driver):
+        """
+        True when releasing this leased driver retires it and no other driver of its key
+        is idle, i.e. the next test of the same kind will have to launch a browser.
+        """
+        with self._lock:
+            key = self._leased.get(id(driver))
+            return (key is not None and self._uses.get(id(driver), 0) + 1 >= self.max_uses
+                    and not self._idle.get(key))
+
+    def discard(self, driver):
+        """Quits a leased driver without returning it to the pool."""
+        with self._lock:
+            self._leased.pop(id(driver), None)
+        self._discard(driver)
+
+    @staticmethod
+    def is_healthy(driver):
+        """Checks that the browser session still answers a trivial command."""
+        try:
+            return driver.execute_script("return 1;") == 1
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def visited_origins(driver):
+        """Origins of the http(s) pages in the navigation history of the current window (Chromium only)."""
+        origins = set()
+        for entry in driver.execute_cdp_cmd("Page.getNavigationHistory", {}).get('entries', []):
+            parts = urlsplit(entry.get('url', ''))
+            if parts.scheme in ('http', 'https'):
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+        return origins
+
+    @staticmethod
+    def reset_state(driver):
+        """
+        Brings a driver back to a neutral state: a single window, no cookies,
+        empty storage and about:blank loaded.
+
+        On Chromium, every storage type (local/session storage, IndexedDB, cache
+        storage, service workers, ...) is cleared through CDP for each origin in the
+        navigation history of every window. Other browsers only get the web storage
+        of the current origin cleared.
+        """
+        cdp = hasattr(driver, "execute_cdp_cmd")
+        origins = set()
+        handles = driver.window_handles
+        for handle in reversed(handles):
+            driver.switch_to.window(handle)
+            if cdp:
+                origins |= DriverPool.visited_origins(driver)
+            if handle != handles[0]:
+                driver.close()
+        driver.switch_to.window(handles[0])
+
+        if cdp:
+            for origin in origins:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException:
+                # Storage is not accessible on opaque origins such as about:blank
+                pass
+            driver.delete_all_cookies()
+
+        driver.get("about:blank")
+
+    def close_all(self):
+        """Quits every driver owned by the pool."""
+        with self._lock:
+            drivers = [driver for idle in self._idle.values() for driver in idle]
+            self._idle.clear()
+            self._leased.clear()
+        for driver in drivers:
+            self._discard(driver)
+        log.info(f"Driver pool closed, {len(drivers)} idle drivers quit")
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            log.warning(f"Error while quitting driver: {e}")
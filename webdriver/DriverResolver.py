@@ -0,0 +1,197 @@
+import os
+import re
+import json
+import time
+import shutil
+import logging
+import platform
+import subprocess
+import threading
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+from utils.path_helper import get_project_root
+
+log = logging.getLogger(__name__)
+
+
+class DriverCacheLock:
+    """
+    Cross-process lock based on an exclusively created lock file, so that
+    pytest-xdist workers do not download or copy the same driver concurrently.
+    """
+
+    def __init__(self, path, timeout=120, stale_after=300):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self._fd = None
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode())
+                return self
+            except FileExistsError:
+                if self._is_stale():
+                    log.warning(f"Removing stale driver cache lock {self.path}")
+                    self._remove()
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for driver cache lock {self.path}")
+                time.sleep(0.2)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        os.close(self._fd)
+        self._fd = None
+        self._remove()
+
+    def _is_stale(self):
+        try:
+            return time.time() - os.path.getmtime(self.path) > self.stale_after
+        except FileNotFoundError:
+            return False
+
+    def _remove(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class DriverResolver:
+    """
+    Maps the locally installed browser version to a cached driver binary.
+
+    The browser version is detected once per process and the driver binary is
+    kept under drivers/<browser>/<version>/, so once the cache is populated no
+    network access is needed to launch a browser.
+    """
+
+    BROWSER_COMMANDS = {
+        'Linux': {
+            'chrome': ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser'],
+            'firefox': ['firefox'],
+            'edge': ['microsoft-edge', 'microsoft-edge-stable'],
+        },
+        'Darwin': {
+            'chrome': ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'],
+            'firefox': ['/Applications/Firefox.app/Contents/MacOS/firefox'],
+            'edge': ['/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge'],
+        },
+    }
+    WINDOWS_REGISTRY_KEYS = {
+        'chrome': (r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon', 'version'),
+        'firefox': (r'HKEY_LOCAL_MACHINE\Software\Mozilla\Mozilla Firefox', 'CurrentVersion'),
+        'edge': (r'HKEY_CURRENT_USER\Software\Microsoft\Edge\BLBeacon', 'version'),
+    }
+    VERSION_PATTERN = re.compile(r'(\d+)\.\d+(?:\.\d+)*')
+
+    _browser_versions = {}
+    _resolved = {}
+    _lock = threading.Lock()
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or os.path.join(get_project_root(), 'drivers')
+        self.manifest_path = os.path.join(self.cache_dir, 'manifest.json')
+
+    def resolve(self, browser):
+        """Returns the path of a driver binary matching the installed browser."""
+        browser = browser.lower()
+        start = time.perf_counter()
+        with self._lock:
+            if browser in self._resolved:
+                return self._resolved[browser]
+
+            version = self.get_browser_version(browser)
+            path = self._lookup(browser, version)
+            source = 'cache'
+            if path is None:
+                path = self._populate(browser, version)
+                source = 'download'
+            self._resolved[browser] = path
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        log.info(f"Resolved {browser} driver for browser version {version} from {source} "
+                 f"in {elapsed_ms:.1f} ms: {path}")
+        return path
+
+    def get_browser_version(self, browser):
+        """Detects the installed browser major version once per process, None when unknown."""
+        if browser not in self._browser_versions:
+            output = self._read_version_output(browser)
+            match = self.VERSION_PATTERN.search(output or '')
+            self._browser_versions[browser] = match.group(1) if match else None
+        return self._browser_versions[browser]
+
+    def _read_version_output(self, browser):
+        system = platform.system()
+        if system == 'Windows':
+            key, value = self.WINDOWS_REGISTRY_KEYS[browser]
+            commands = [['reg', 'query', key, '/v', value]]
+        else:
+            commands = [[binary, '--version'] for binary in self.BROWSER_COMMANDS.get(system, {}).get(browser, [])]
+
+        for command in commands:
+            try:
+                result = subprocess.run(command, capture_output=True, text=True, timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                continue
+            if result.returncode == 0 and result.stdout:
+                return result.stdout
+        log.warning(f"Could not detect installed {browser} version")
+        return None
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _lookup(self, browser, version):
+        if version is None:
+            return None
+        path = self._read_manifest().get(browser, {}).get(version)
+        if path and os.path.isfile(path):
+            return path
+        return None
+
+    def _populate(self, browser, version):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with DriverCacheLock(os.path.join(self.cache_dir, f'{browser}.lock')):
+            # Another worker may have populated the cache while we waited for the lock
+            path = self._lookup(browser, version)
+            if path is not None:
+                return path
+
+            downloaded = self._download(browser)
+            if version is None:
+                return downloaded
+
+            target_dir = os.path.join(self.cache_dir, browser, version)
+            os.makedirs(target_dir, exist_ok=True)
+            path = os.path.join(target_dir, os.path.basename(downloaded))
+            shutil.copy2(downloaded, path)
+
+            manifest = self._read_manifest()
+            manifest.setdefault(browser, {})[version] = path
+            tmp_path = self.manifest_path + f'.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+            return path
+
+    @staticmethod
+    def _download(browser):
+        if browser == 'chrome':
+            return ChromeDriverManager().install()
+        elif browser == 'firefox':
+            return GeckoDriverManager().install()
+        elif browser == 'edge':
+            return EdgeChromiumDriverManager().install()
+        raise ValueError(f"Unsupported browser: {browser}")
@@ -2,13 +2,15 @@ import os
 import platform
 import logging
 from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
 
+from webdriver.DriverResolver import DriverResolver
+from webdriver.LaunchProfiles import get_launch_profile
+from webdriver.BrowserScripts import NETWORK_TRACKER_JS
+from webdriver.CommandTiming import instrument
+
 
 class LaunchBrowser:
     driver_path = os.getcwd()
@@ -23,28 +25,46 @@ class LaunchBrowser:
         ChromeDriverPath = os.path.join(driver_path, "drivers/windows_chromedriver/chromedriver")
 
     log = logging
+    driver_resolver = DriverResolver()
 
-    def __init__(self):
-        pass
+    def __init__(self, profile="default", blocked_urls=(), performance_log=False, page_load_strategy="normal",
+                 implicit_wait=5, command_timing=True):
+        """
+        :param profile: Name of a launch profile from webdriver/LaunchProfiles.py.
+        :param blocked_urls: Extra URL patterns blocked through CDP on Chromium based browsers.
+        :param performance_log: Enables the Chromium performance log, used to account blocked requests.
+        :param page_load_strategy: 'normal' waits for the load event, 'eager' for DOMContentLoaded
+                                   and 'none' returns right after the navigation starts.
+        :param implicit_wait: Implicit wait in seconds; 0 leaves all waiting to explicit waits.
+        :param command_timing: Records name, duration and payload size of every WebDriver command.
+        """
+        if page_load_strategy not in ("normal", "eager", "none"):
+            raise ValueError(f"Unsupported page load strategy: {page_load_strategy}")
+        self.page_load_strategy = page_load_strategy
+        self.implicit_wait = implicit_wait
+        self.command_timing = command_timing
+        self.profile_name = profile
+        self.profile = get_launch_profile(profile)
+        self.blocked_urls = list(self.profile['blocked_urls']) + list(blocked_urls)
+        self.performance_log = performance_log
 
     def launch_browser(self, host, browser="chrome", headless=False):
         browser = browser.lower()
+        if browser in ("chrome", "firefox", "edge"):
+            driver_manager = self.driver_resolver.resolve(browser)
 
         if browser == "chrome":
             options = webdriver.ChromeOptions()
-            driver_manager = ChromeDriverManager().install()
             service = ChromeService(executable_path=driver_manager)
             driver_class = webdriver.Chrome
 
         elif browser == "firefox":
             options = webdriver.FirefoxOptions()
-            driver_manager = GeckoDriverManager().install()
             service = FirefoxService(executable_path=driver_manager)
             driver_class = webdriver.Firefox
 
         elif browser == "edge":
             options = webdriver.EdgeOptions()
-            driver_manager = EdgeChromiumDriverManager().install()
             service = EdgeService(executable_path=driver_manager)
             driver_class = webdriver.Edge
 
@@ -52,6 +72,7 @@ class LaunchBrowser:
             raise ValueError(f"Unsupported browser: {browser}")
 
         files_downloaded_dir = os.path.join(os.getcwd(), 'file_downloaded')
+        profile_prefs = self.profile['prefs'].get(browser, {})
         if browser == "chrome":
             prefs = {
                 'download.default_directory': files_downloaded_dir,
@@ -59,7 +80,13 @@ class LaunchBrowser:
                 "download.directory_upgrade": True,
                 "safebrowsing.enabled": True
             }
+            prefs.update(profile_prefs)
             options.add_experimental_option('prefs', prefs)
+        elif browser == "edge" and profile_prefs:
+            options.add_experimental_option('prefs', profile_prefs)
+        elif browser == "firefox":
+            for name, value in profile_prefs.items():
+                options.set_preference(name, value)
 
         if headless:
             if browser == "chrome":
@@ -72,7 +99,8 @@ class LaunchBrowser:
                 options.add_argument("--start-maximized")
 
         # Common arguments
-        options.add_argument('--verbose')
+        if self.profile['verbose_logging']:
+            options.add_argument('--verbose')
         options.add_argument("--test-type")
         options.add_argument("--no-sandbox")
         options.add_argument("--incognito")
@@ -81,7 +109,66 @@ class LaunchBrowser:
         options.add_argument("--ignore-ssl-errors=yes")
         options.add_argument("--ignore-certificate-errors")
 
-        self.log.info(f'Launching {browser.capitalize()} browser')
+        for argument in self.profile['arguments'].get(browser, []):
+            options.add_argument(argument)
+
+        options.page_load_strategy = self.page_load_strategy
+
+        if self.performance_log and browser in ("chrome", "edge"):
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            # Only Network events are read; Page and timeline events would just make the log larger
+            options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+        self.log.info(f'Launching {browser.capitalize()} browser with {self.profile_name} profile')
         driver = driver_class(service=service, options=options)
-        driver.implicitly_wait(5)
+        if self.command_timing:
+            instrument(driver)
+        driver.implicitly_wait(self.implicit_wait)
+        self.apply_page_setup(driver)
         return driver
+
+    def apply_page_setup(self, driver):
+        """
+        Applies the CDP part of the launch profile (blocked URLs, new-document scripts)
+        to the driver's current target, and installs the network activity tracker used
+        by WebDriverHelper.wait_for_network_idle from the start of every document.
+        Must be repeated after switching to a new browser context, since CDP settings
+        are scoped to a target.
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_TRACKER_JS})
+        if self.blocked_urls:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+        for script in self.profile['page_scripts']:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+
+    @staticmethod
+    def supports_browser_contexts(driver):
+        """Browser context isolation relies on CDP, which only Chromium based drivers expose."""
+        return hasattr(driver, "execute_cdp_cmd")
+
+    @staticmethod
+    def open_browser_context(driver):
+        """
+        Creates a new CDP browser context with its own page target and switches
+        the driver to it. Cookies and storage are isolated from every other
+        context in the same browser process.
+
+        :return: Id of the browser context, needed to dispose it.
+        """
+        context_id = driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+        target_id = driver.execute_cdp_cmd(
+            "Target.createTarget", {"url": "about:blank", "browserContextId": context_id})["targetId"]
+        handle = next(handle for handle in driver.window_handles if handle.endswith(target_id))
+        driver.switch_to.window(handle)
+        LaunchBrowser.log.info(f'Opened browser context {context_id}')
+        return context_id
+
+    @staticmethod
+    def close_browser_context(driver, context_id, return_handle):
+        """Disposes a browser context with all its targets and switches back to return_handle."""
+        driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+        driver.switch_to.window(return_handle)
+        LaunchBrowser.log.info(f'Disposed browser context {context_id}')
@@ -0,0 +1,71 @@
+# Named launch profiles for LaunchBrowserNew.LaunchBrowser.
+#
+# A profile adds browser arguments and preferences at launch time, and for
+# Chromium based browsers a list of CDP URL patterns to block and scripts to
+# run in every new document.
+
+DISABLE_ANIMATIONS_SCRIPT = """
+(function () {
+    var css = '*, *::before, *::after {' +
+        'animation-duration: 0s !important; animation-delay: 0s !important;' +
+        'transition-duration: 0s !important; transition-delay: 0s !important;' +
+        'scroll-behavior: auto !important; }';
+    function inject() {
+        var style = document.createElement('style');
+        style.textContent = css;
+        document.documentElement.appendChild(style);
+    }
+    if (document.documentElement) {
+        inject();
+    } else {
+        new MutationObserver(function (mutations, observer) {
+            if (document.documentElement) {
+                observer.disconnect();
+                inject();
+            }
+        }).observe(document, {childList: true});
+    }
+})();
+"""
+
+FONT_AND_MEDIA_URL_PATTERNS = [
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.ogg', '*.mp3', '*.wav', '*.m3u8',
+]
+
+LAUNCH_PROFILES = {
+    'default': {
+        'verbose_logging': True,
+        'arguments': {},
+        'prefs': {},
+        'blocked_urls': [],
+        'page_scripts': [],
+    },
+    'fast': {
+        'verbose_logging': False,
+        'arguments': {
+            'chrome': ['--blink-settings=imagesEnabled=false', '--force-prefers-reduced-motion',
+                       '--autoplay-policy=user-gesture-required', '--log-level=3'],
+            'edge': ['--blink-settings=imagesEnabled=false', '--force-prefers-reduced-motion',
+                     '--autoplay-policy=user-gesture-required', '--log-level=3'],
+        },
+        'prefs': {
+            'chrome': {'profile.managed_default_content_settings.images': 2},
+            'edge': {'profile.managed_default_content_settings.images': 2},
+            'firefox': {
+                'permissions.default.image': 2,
+                'gfx.downloadable_fonts.enabled': False,
+                'media.autoplay.default': 5,
+                'ui.prefersReducedMotion': 1,
+            },
+        },
+        'blocked_urls': FONT_AND_MEDIA_URL_PATTERNS,
+        'page_scripts': [DISABLE_ANIMATIONS_SCRIPT],
+    },
+}
+
+
+def get_launch_profile(name):
+    if name not in LAUNCH_PROFILES:
+        raise ValueError(f"Unknown browser profile: {name}. Available: {', '.join(LAUNCH_PROFILES)}")
+    return LAUNCH_PROFILES[name]
@@ -0,0 +1,43 @@
+from selenium.webdriver.common.by import By
+
+# Legacy strategy names used by WebDriverHelper.find_element(condition, locator, value, wait_time).
+# The By values themselves map to themselves, so both spellings resolve with one lookup.
+STRATEGIES = {
+    'xpath': By.XPATH,
+    'id': By.ID,
+    'css': By.CSS_SELECTOR,
+    'classname': By.CLASS_NAME,
+    'tagname': By.TAG_NAME,
+    'linktext': By.LINK_TEXT,
+    'partiallinktext': By.PARTIAL_LINK_TEXT,
+    'name': By.NAME,
+}
+STRATEGIES.update({by: by for by in list(STRATEGIES.values())})
+
+DEFAULT_WAIT_TIME = 30
+
+
+def parse_find_args(locator, args):
+    """
+    Normalizes the arguments following the condition in a find_element call.
+
+    Both signatures are accepted:
+        find_element(condition, (By.XPATH, value)[, wait_time])
+        find_element(condition, 'xpath', value[, wait_time])
+
+    :return: (locator tuple, wait time in seconds); an empty or missing wait time means 30.
+    """
+    if isinstance(locator, str):
+        if not args or len(args) > 2:
+            raise TypeError(f"Expected a value and an optional wait time for strategy '{locator}', got {args}")
+        strategy, value = locator, args[0]
+        wait_time = args[1] if len(args) > 1 else None
+    else:
+        if len(args) > 1:
+            raise TypeError(f"Unexpected arguments after locator {tuple(locator)}: {args[1:]}")
+        strategy, value = locator
+        wait_time = args[0] if args else None
+    by = STRATEGIES.get(strategy)
+    if by is None:
+        raise ValueError(f"Unknown locator strategy: {strategy}")
+    return (by, value), wait_time or DEFAULT_WAIT_TIME
@@ -0,0 +1,105 @@
+import os
+import json
+import logging
+import threading
+from fnmatch import fnmatchcase
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.path_helper import get_project_root
+
+log = logging.getLogger(__name__)
+
+
+class NetworkBlocker:
+    """
+    Accounts for the requests blocked by CDP Network.setBlockedURLs.
+
+    Blocked requests are read from the Chrome performance log, which the
+    launcher enables (Network domain only) when --network-accounting is given. Blocked requests never
+    reach the network, so bytes saved are estimated from the size each URL had
+    the last time it was loaded without the blocklist (e.g. a run with
+    --network-blocklist=off); those sizes are kept in a small JSON cache.
+    """
+
+    def __init__(self, patterns, sizes_path=None):
+        self.patterns = list(patterns)
+        self.sizes_path = sizes_path or os.path.join(
+            get_project_root(), 'testResults', 'NetworkBlocklist', 'asset_sizes.json')
+        self.known_sizes = self._load_sizes()
+        self.total_blocked = 0
+        self.total_bytes_saved = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def supports(driver):
+        return hasattr(driver, "execute_cdp_cmd") and hasattr(driver, "get_log")
+
+    def matches(self, url):
+        return any(fnmatchcase(url, pattern) for pattern in self.patterns)
+
+    def start(self, driver):
+        """Discards performance log entries left over from earlier tests on a reused driver."""
+        if self.supports(driver):
+            self._read_events(driver)
+
+    def collect(self, driver):
+        """
+        Returns the blocked request count and estimated bytes saved since start().
+
+        :return: dict with 'blocked_requests', 'bytes_saved' and 'blocked_urls'.
+        """
+        stats = {'blocked_requests': 0, 'bytes_saved': 0, 'blocked_urls': []}
+        if not self.supports(driver):
+            return stats
+
+        urls = {}
+        learned = False
+        for method, params in self._read_events(driver):
+            if method == 'Network.requestWillBeSent':
+                urls[params['requestId']] = params['request']['url']
+            elif method == 'Network.loadingFailed' and params.get('blockedReason') == 'inspector':
+                url = urls.get(params['requestId'], '')
+                stats['blocked_requests'] += 1
+                stats['bytes_saved'] += self.known_sizes.get(url, 0)
+                stats['blocked_urls'].append(url)
+            elif method == 'Network.loadingFinished':
+                url = urls.get(params['requestId'])
+                if url and self.matches(url):
+                    self.known_sizes[url] = int(params.get('encodedDataLength', 0))
+                    learned = True
+
+        with self._lock:
+            self.total_blocked += stats['blocked_requests']
+            self.total_bytes_saved += stats['bytes_saved']
+            if learned:
+                self._save_sizes()
+        return stats
+
+    def summary(self):
+        return f"{self.total_blocked} requests blocked, ~{self.total_bytes_saved / 1024:.1f} KiB saved"
+
+    @staticmethod
+    def _read_events(driver):
+        try:
+            entries = driver.get_log('performance')
+        except WebDriverException as e:
+            log.warning(f"Could not read performance log: {e}")
+            return []
+        events = []
+        for entry in entries:
+            message = json.loads(entry['message'])['message']
+            events.append((message['method'], message.get('params', {})))
+        return events
+
+    def _load_sizes(self):
+        try:
+            with open(self.sizes_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_sizes(self):
+        os.makedirs(os.path.dirname(self.sizes_path), exist_ok=True)
+        with open(self.sizes_path, 'w') as f:
+            json.dump(self.known_sizes, f, indent=2)
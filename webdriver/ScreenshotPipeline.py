@@ -0,0 +1,135 @@
+import os
+import time
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+
+log = logging.getLogger(__name__)
+
+# Format -> (file extension, name of the OpenCV quality flag); OpenCV is imported on first thumbnail
+THUMBNAIL_ENCODINGS = {
+    'webp': ('.webp', 'IMWRITE_WEBP_QUALITY'),
+    'jpeg': ('.jpg', 'IMWRITE_JPEG_QUALITY'),
+}
+
+
+class ScreenshotPipeline:
+    """
+    Takes failure screenshots with a single WebDriver capture and writes them off the test thread.
+
+    capture() grabs the PNG once and names it after its content hash, so the report
+    references are known immediately and identical screenshots are stored once. Writing
+    the file and encoding the downscaled thumbnail happen on a background thread;
+    flush() waits for the queue at the end of the session.
+    """
+
+    def __init__(self, directory=None, thumbnail_format='webp', thumbnail_width=320, quality=70):
+        if thumbnail_format and thumbnail_format not in THUMBNAIL_ENCODINGS:
+            raise ValueError(f"Unknown thumbnail format: {thumbnail_format}")
+        self.directory = directory
+        self.thumbnail_format = thumbnail_format
+        self.thumbnail_width = thumbnail_width
+        self.quality = quality
+        self.stats = {'captured': 0, 'stored': 0, 'duplicates': 0, 'thumbnail_failures': 0,
+                      'capture_ms': 0.0, 'encode_ms': 0.0}
+        self._thumbnail_support = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='screenshots')
+        self._pending = []
+
+    def capture(self, driver):
+        """
+        Takes one screenshot and queues it for storage.
+
+        :return: dict with the PNG bytes and the file names of the full image and the
+            thumbnail (None when thumbnails are off), relative to the directory.
+        """
+        start = time.perf_counter()
+        png = driver.get_screenshot_as_png()
+        self.stats['capture_ms'] += (time.perf_counter() - start) * 1000
+        self.stats['captured'] += 1
+
+        digest = hashlib.sha256(png).hexdigest()[:24]
+        screenshot = {
+            'png': png,
+            'image': f"{digest}.png",
+            'thumbnail': f"{digest}_thumb{THUMBNAIL_ENCODINGS[self.thumbnail_format][0]}"
+            if self.thumbnails_supported() else None,
+        }
+        self._pending.append(self._executor.submit(self._store, screenshot))
+        return screenshot
+
+    def thumbnails_supported(self):
+        """Whether OpenCV is available and can encode the configured thumbnail format; checked once per format."""
+        if not self.thumbnail_format:
+            return False
+        if self.thumbnail_format not in self._thumbnail_support:
+            try:
+                import cv2
+                supported = cv2.haveImageWriter(f"thumbnail{THUMBNAIL_ENCODINGS[self.thumbnail_format][0]}")
+            except ImportError:
+                supported = False
+            if not supported:
+                log.warning(f"Cannot encode {self.thumbnail_format} thumbnails, linking full screenshots instead")
+            self._thumbnail_support[self.thumbnail_format] = supported
+        return self._thumbnail_support[self.thumbnail_format]
+
+    def _store(self, screenshot):
+        start = time.perf_counter()
+        os.makedirs(self.directory, exist_ok=True)
+        image_path = os.path.join(self.directory, screenshot['image'])
+        if os.path.exists(image_path):
+            self.stats['duplicates'] += 1
+            return
+        # The full image is written first, so a thumbnail failure never loses the screenshot
+        self._write(image_path, screenshot['png'])
+        self.stats['stored'] += 1
+        if screenshot['thumbnail']:
+            try:
+                self._write(os.path.join(self.directory, screenshot['thumbnail']),
+                            self._thumbnail(screenshot['png']))
+            except Exception as e:
+                self.stats['thumbnail_failures'] += 1
+                log.warning(f"Could not create thumbnail for {screenshot['image']}: {e}")
+        self.stats['encode_ms'] += (time.perf_counter() - start) * 1000
+
+    def _thumbnail(self, png):
+        import cv2
+        import numpy
+
+        image = cv2.imdecode(numpy.frombuffer(png, numpy.uint8), cv2.IMREAD_COLOR)
+        height, width = image.shape[:2]
+        if width > self.thumbnail_width:
+            size = (self.thumbnail_width, max(1, round(height * self.thumbnail_width / width)))
+            image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+        extension, quality_flag = THUMBNAIL_ENCODINGS[self.thumbnail_format]
+        ok, encoded = cv2.imencode(extension, image, [getattr(cv2, quality_flag), self.quality])
+        if not ok:
+            raise ValueError(f"Could not encode {self.thumbnail_format} thumbnail")
+        return encoded.tobytes()
+
+    @staticmethod
+    def _write(path, data):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def flush(self, timeout=60):
+        """Waits until the queued screenshots are stored and logs the ones that failed."""
+        done, not_done = wait(self._pending, timeout=timeout)
+        for future in done:
+            if future.exception() is not None:
+                log.warning(f"Failed to store screenshot: {future.exception()}")
+        if not_done:
+            log.warning(f"{len(not_done)} screenshots still being stored after {timeout}s")
+        self._pending = list(not_done)
+
+    def shutdown(self):
+        self.flush()
+        self._executor.shutdown(wait=False)
+
+    def summary(self):
+        return (f"Screenshots: {self.stats['captured']} captured in {self.stats['capture_ms']:.0f} ms, "
+                f"{self.stats['stored']} stored ({self.stats['duplicates']} duplicates, "
+                f"{self.stats['thumbnail_failures']} without thumbnail) "
+                f"in {self.stats['encode_ms']:.0f} ms off the test thread")
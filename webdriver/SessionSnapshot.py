@@ -0,0 +1,178 @@
+import os
+import re
+import json
+import time
+import logging
+
+from selenium.common.exceptions import WebDriverException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.path_helper import get_project_root
+from webdriver.DriverResolver import DriverCacheLock
+
+log = logging.getLogger(__name__)
+
+READ_STORAGE_SCRIPT = """
+function dump(storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+}
+return {origin: window.location.origin, local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+WRITE_STORAGE_SCRIPT = """
+var snapshot = arguments[0];
+if (window.location.origin === snapshot.origin) {
+    Object.keys(snapshot.local).forEach(function (key) { window.localStorage.setItem(key, snapshot.local[key]); });
+    Object.keys(snapshot.session).forEach(function (key) { window.sessionStorage.setItem(key, snapshot.session[key]); });
+}
+"""
+
+
+class SessionSnapshot:
+    """
+    Saves the authenticated state of a role (cookies plus localStorage and
+    sessionStorage) after one UI login and injects it into later drivers, so
+    tests do not have to go through the login form every time.
+
+    Snapshots are JSON files under .session_snapshots/ that expire after
+    ``ttl`` seconds or when the first auth cookie expires, whichever is first.
+    """
+
+    def __init__(self, cache_dir=None, ttl=3600, login_timeout=30):
+        self.cache_dir = cache_dir or os.path.join(get_project_root(), '.session_snapshots')
+        self.ttl = ttl
+        self.login_timeout = login_timeout
+
+    def _path(self, role):
+        return os.path.join(self.cache_dir, re.sub(r'[^\w.-]', '_', role) + '.json')
+
+    def capture(self, driver, role):
+        """Stores the current cookies and web storage of the driver for the role."""
+        state = driver.execute_script(READ_STORAGE_SCRIPT)
+        cookies = driver.get_cookies()
+        expires_at = time.time() + self.ttl
+        cookie_expiries = [cookie['expiry'] for cookie in cookies if 'expiry' in cookie]
+        if cookie_expiries:
+            expires_at = min(expires_at, min(cookie_expiries))
+
+        snapshot = {
+            'role': role,
+            'origin': state['origin'],
+            'cookies': cookies,
+            'local': state['local'],
+            'session': state['session'],
+            'expires_at': expires_at,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self._path(role) + f'.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self._path(role))
+        log.info(f"Captured session snapshot for role '{role}' ({len(cookies)} cookies)")
+        return snapshot
+
+    def load(self, role):
+        """Returns the stored snapshot of the role, or None when missing or expired."""
+        try:
+            with open(self._path(role)) as f:
+                snapshot = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if snapshot['expires_at'] <= time.time():
+            log.info(f"Session snapshot for role '{role}' expired")
+            return None
+        return snapshot
+
+    def invalidate(self, role):
+        try:
+            os.remove(self._path(role))
+        except FileNotFoundError:
+            pass
+
+    def inject(self, driver, snapshot):
+        """
+        Seeds cookies and web storage into the driver before it navigates to the
+        application. With CDP this happens without loading any page; otherwise the
+        driver briefly opens the origin to be allowed to set its cookies.
+
+        :return: Identifier of the CDP new-document script, to be passed to cleanup().
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            cookies = [self._to_cdp_cookie(cookie, snapshot['origin']) for cookie in snapshot['cookies']]
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            source = "(function () {" + WRITE_STORAGE_SCRIPT.replace('arguments[0]', json.dumps(snapshot)) + "})();"
+            return driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})['identifier']
+
+        driver.get(snapshot['origin'] + '/favicon.ico')
+        for cookie in snapshot['cookies']:
+            driver.add_cookie(cookie)
+        driver.execute_script(WRITE_STORAGE_SCRIPT, snapshot)
+        return None
+
+    @staticmethod
+    def cleanup(driver, script_id):
+        """Stops seeding web storage into new documents once the session has been restored."""
+        if script_id is not None:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script_id})
+
+    @staticmethod
+    def _to_cdp_cookie(cookie, origin):
+        cdp_cookie = {key: cookie[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly')
+                      if key in cookie}
+        if 'expiry' in cookie:
+            cdp_cookie['expires'] = cookie['expiry']
+        if 'sameSite' in cookie:
+            cdp_cookie['sameSite'] = cookie['sameSite']
+        if 'domain' not in cdp_cookie:
+            cdp_cookie['url'] = origin
+        return cdp_cookie
+
+    def login(self, driver, role, url, ui_login, is_logged_in):
+        """
+        Opens url as an authenticated user of the role.
+
+        The stored snapshot is injected when available; if the application rejects it
+        (is_logged_in() returns False after navigating), or there is none, ui_login()
+        is performed and a new snapshot is captured. Concurrent xdist workers share one
+        UI login per role through a lock file.
+
+        :param ui_login: Callable performing the real UI login, starting from any page.
+        :param is_logged_in: Callable returning True when the driver shows an authenticated page.
+        """
+        snapshot = self.load(role)
+        if snapshot is not None and self._restore(driver, role, snapshot, url, is_logged_in):
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with DriverCacheLock(self._path(role) + '.lock'):
+            # Another worker may have logged in while we waited for the lock
+            snapshot = self.load(role)
+            if snapshot is not None and self._restore(driver, role, snapshot, url, is_logged_in):
+                return
+            ui_login()
+            try:
+                WebDriverWait(driver, self.login_timeout).until(lambda _: is_logged_in())
+            except TimeoutException:
+                log.warning(f"UI login for role '{role}' did not reach an authenticated page, snapshot not saved")
+                return
+            self.capture(driver, role)
+
+    def _restore(self, driver, role, snapshot, url, is_logged_in):
+        try:
+            script_id = self.inject(driver, snapshot)
+            driver.get(url)
+            self.cleanup(driver, script_id)
+            if is_logged_in():
+                log.info(f"Restored session snapshot for role '{role}'")
+                return True
+        except WebDriverException as e:
+            log.warning(f"Failed to inject session snapshot for role '{role}': {e}")
+        log.info(f"Session snapshot for role '{role}' was rejected, falling back to UI login")
+        self.invalidate(role)
+        driver.delete_all_cookies()
+        return False
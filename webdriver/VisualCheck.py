@@ -0,0 +1,159 @@
+import os
+import time
+import logging
+
+from utils.path_helper import get_project_root
+
+log = logging.getLogger(__name__)
+
+
+class VisualComparator:
+    """
+    Compares screenshots against stored baselines.
+
+    Comparisons run in three stages so that the expensive one only sees what changed:
+      1. exact comparison of the masked images, which settles the common "nothing changed" case;
+      2. a downsampled pass: the absolute difference is averaged over tile_size x tile_size
+         tiles and tiles above pixel_tolerance are grouped into differing regions;
+      3. SSIM on each differing region only. The check fails when any region scores
+         below threshold.
+
+    Ignore regions are (x, y, width, height) rectangles in image pixels that are blanked
+    in both images before comparing. A missing baseline is created from the screenshot.
+
+    OpenCV, numpy and scikit-image are imported on first use, so page objects and
+    API-only runs do not pay for loading them.
+    """
+
+    def __init__(self, baseline_dir=None, diff_dir=None, threshold=0.98, tile_size=16, pixel_tolerance=4):
+        results_dir = os.path.join(get_project_root(), 'testResults')
+        self.baseline_dir = baseline_dir or os.path.join(results_dir, 'VisualBaselines')
+        self.diff_dir = diff_dir or os.path.join(results_dir, 'VisualDiffs')
+        self.threshold = threshold
+        self.tile_size = tile_size
+        self.pixel_tolerance = pixel_tolerance
+        # Overwrite baselines with the new screenshots instead of comparing
+        self.update_baselines = False
+        self.stats = {'comparisons': 0, 'exact': 0, 'prefiltered': 0, 'ssim_regions': 0, 'seconds': 0.0}
+        self._baselines = {}
+
+    def baseline_path(self, name):
+        return os.path.join(self.baseline_dir, f"{name}.png")
+
+    def compare(self, name, png, ignore_regions=(), threshold=None):
+        """
+        Compares a PNG screenshot with the baseline stored under name.
+
+        :return: dict with 'passed', 'score' (lowest SSIM over the differing regions, 1.0 when
+            none differ), 'regions' (x, y, width, height of the regions that failed) and
+            'diff_path' (image with the failing regions outlined, None when passed).
+        """
+        import cv2
+        import numpy
+
+        start = time.perf_counter()
+        threshold = self.threshold if threshold is None else threshold
+        actual = cv2.imdecode(numpy.frombuffer(png, numpy.uint8), cv2.IMREAD_GRAYSCALE)
+        baseline = None if self.update_baselines else self._load_baseline(name)
+        if baseline is None:
+            self._save_baseline(name, png, actual)
+            log.info(f"Stored visual baseline {self.baseline_path(name)}")
+            return {'passed': True, 'score': 1.0, 'regions': [], 'diff_path': None, 'baseline_created': True}
+
+        try:
+            if baseline.shape != actual.shape:
+                diff_path = self._write_diff(name, actual, [(0, 0, actual.shape[1], actual.shape[0])])
+                return {'passed': False, 'score': 0.0, 'regions': [], 'diff_path': diff_path,
+                        'reason': f"size {actual.shape[1]}x{actual.shape[0]} differs from baseline "
+                                  f"{baseline.shape[1]}x{baseline.shape[0]}"}
+            score, failed = self._compare_images(baseline, actual, ignore_regions, threshold)
+            diff_path = self._write_diff(name, actual, failed) if failed else None
+            return {'passed': not failed, 'score': score, 'regions': failed, 'diff_path': diff_path}
+        finally:
+            self.stats['comparisons'] += 1
+            self.stats['seconds'] += time.perf_counter() - start
+
+    def _compare_images(self, baseline, actual, ignore_regions, threshold):
+        import numpy
+        from skimage.metrics import structural_similarity
+
+        if ignore_regions:
+            baseline, actual = baseline.copy(), actual.copy()
+            for x, y, width, height in ignore_regions:
+                # Regions may start outside the image, e.g. elements overlapping an element crop
+                rows = slice(max(0, y), max(0, y + height))
+                columns = slice(max(0, x), max(0, x + width))
+                baseline[rows, columns] = 0
+                actual[rows, columns] = 0
+
+        if numpy.array_equal(baseline, actual):
+            self.stats['exact'] += 1
+            return 1.0, []
+
+        regions = self.differing_regions(baseline, actual)
+        if not regions:
+            self.stats['prefiltered'] += 1
+            return 1.0, []
+
+        score, failed = 1.0, []
+        for x, y, width, height in regions:
+            self.stats['ssim_regions'] += 1
+            region_score = structural_similarity(
+                baseline[y:y + height, x:x + width], actual[y:y + height, x:x + width], data_range=255)
+            score = min(score, region_score)
+            if region_score < threshold:
+                failed.append((x, y, width, height))
+        return score, failed
+
+    def differing_regions(self, baseline, actual):
+        """Returns the bounding boxes of connected tiles whose mean difference exceeds pixel_tolerance."""
+        import cv2
+        import numpy
+
+        height, width = actual.shape
+        tile = self.tile_size
+        grid = (max(1, -(-width // tile)), max(1, -(-height // tile)))
+        diff = cv2.resize(cv2.absdiff(baseline, actual), grid, interpolation=cv2.INTER_AREA)
+        changed = (diff > self.pixel_tolerance).astype(numpy.uint8)
+        if not changed.any():
+            return []
+
+        count, _, boxes, _ = cv2.connectedComponentsWithStats(changed, connectivity=8)
+        regions = []
+        for left, top, tiles_wide, tiles_high, _ in boxes[1:count]:
+            # One tile of padding keeps SSIM's 7x7 window meaningful on small changes
+            x, y = max(0, (left - 1) * tile), max(0, (top - 1) * tile)
+            regions.append((int(x), int(y), int(min(width, (left + tiles_wide + 1) * tile) - x),
+                            int(min(height, (top + tiles_high + 1) * tile) - y)))
+        return regions
+
+    def _load_baseline(self, name):
+        if name not in self._baselines:
+            path = self.baseline_path(name)
+            if not os.path.exists(path):
+                return None
+            import cv2
+            self._baselines[name] = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+        return self._baselines[name]
+
+    def _save_baseline(self, name, png, image):
+        os.makedirs(self.baseline_dir, exist_ok=True)
+        with open(self.baseline_path(name), 'wb') as f:
+            f.write(png)
+        self._baselines[name] = image
+
+    def _write_diff(self, name, actual, regions):
+        import cv2
+
+        os.makedirs(self.diff_dir, exist_ok=True)
+        image = cv2.cvtColor(actual, cv2.COLOR_GRAY2BGR)
+        for x, y, width, height in regions:
+            cv2.rectangle(image, (x, y), (x + width - 1, y + height - 1), (0, 0, 255), 2)
+        path = os.path.join(self.diff_dir, f"{name}.png")
+        cv2.imwrite(path, image)
+        return path
+
+    def summary(self):
+        return (f"Visual checks: {self.stats['comparisons']} comparisons in {self.stats['seconds']:.2f}s "
+                f"({self.stats['exact']} identical, {self.stats['prefiltered']} within tolerance, "
+                f"{self.stats['ssim_regions']} regions scored with SSIM)")
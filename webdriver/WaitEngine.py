@@ -0,0 +1,158 @@
+import time
+import logging
+
+from selenium.common import exceptions
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from webdriver.BrowserScripts import WAIT_FOR_CONDITION_JS, WAIT_FOR_QUIET_JS
+
+log = logging.getLogger(__name__)
+
+
+def _element_located_selected(locator):
+    def _predicate(driver):
+        element = driver.find_element(*locator)
+        return element if element.is_selected() else False
+    return _predicate
+
+
+def _element_attribute_equals(locator, attribute, expected_value):
+    def _predicate(driver):
+        return driver.find_element(*locator).get_attribute(attribute) == expected_value
+    return _predicate
+
+
+class WaitEngine:
+    """
+    Explicit wait engine that evaluates conditions inside the browser.
+
+    A MutationObserver installed through execute_async_script re-checks the
+    condition whenever the DOM changes, so the wait returns as soon as the
+    condition holds instead of on the next 500 ms WebDriverWait poll, and costs
+    one WebDriver command instead of several per poll. When the script cannot
+    run, the engine falls back to WebDriverWait polling with the equivalent
+    expected condition.
+
+    Conditions: 'presence', 'visible', 'clickable', 'selected' (return the
+    element), 'text' (expected text contained), 'attribute' (attribute equals
+    expected) and 'invisible' (return True).
+    """
+
+    CONDITIONS = ('presence', 'visible', 'clickable', 'selected', 'text', 'attribute', 'invisible')
+
+    # Stay below the default 30 s WebDriver script timeout; longer waits are chunked
+    SCRIPT_CHUNK_SECONDS = 25
+
+    def __init__(self, driver, poll_frequency=0.5):
+        self.driver = driver
+        self.poll_frequency = poll_frequency
+        self.scripts_supported = True
+        # URL of the document the last successful wait was evaluated in, None after a polling fallback
+        self.last_url = None
+
+    # Polling equivalents of the element conditions, keyed by condition name
+    POLLING_CONDITIONS = {
+        'presence': EC.presence_of_element_located,
+        'visible': EC.visibility_of_element_located,
+        'clickable': EC.element_to_be_clickable,
+        'selected': _element_located_selected,
+        'invisible': EC.invisibility_of_element_located,
+    }
+
+    @staticmethod
+    def polling_condition(condition, locator, expected=None, attribute=None):
+        """Returns the WebDriverWait expected condition equivalent to an engine condition."""
+        if condition == 'text':
+            return EC.text_to_be_present_in_element(locator, expected)
+        elif condition == 'attribute':
+            return _element_attribute_equals(locator, attribute, expected)
+        try:
+            return WaitEngine.POLLING_CONDITIONS[condition](locator)
+        except KeyError:
+            raise ValueError(f"Unknown condition: {condition}") from None
+
+    def until(self, condition, locator, wait_time=30, expected=None, attribute=None):
+        """
+        Waits until the condition holds for the locator.
+
+        :return: The matching WebElement for element conditions, True otherwise.
+        :raises TimeoutException: When the condition does not hold within wait_time seconds.
+        """
+        if condition not in self.CONDITIONS:
+            raise ValueError(f"Unknown condition: {condition}")
+
+        self.last_url = None
+        deadline = time.monotonic() + wait_time
+        while self.scripts_supported:
+            remaining = deadline - time.monotonic()
+            chunk = min(max(remaining, 0), self.SCRIPT_CHUNK_SECONDS)
+            try:
+                result = self.driver.execute_async_script(
+                    WAIT_FOR_CONDITION_JS, locator[0], locator[1], condition, expected, attribute, int(chunk * 1000)
+                )
+            except exceptions.JavascriptException as e:
+                if 'unloaded' in str(e):
+                    # The page navigated while waiting; evaluate again on the new document
+                    continue
+                log.warning(f"In-browser wait failed, falling back to polling: {e}")
+                self.scripts_supported = False
+                break
+            except exceptions.TimeoutException:
+                # Script timeout shorter than the chunk; keep waiting by polling
+                break
+
+            if result.get('error'):
+                log.warning(f"In-browser wait could not evaluate {condition} for {locator}: {result['error']}")
+                break
+            if result['met']:
+                self.last_url = result['url']
+                return result['value'] if result['value'] is not None else True
+            if time.monotonic() >= deadline:
+                raise exceptions.TimeoutException(
+                    f"Condition '{condition}' not met for {locator} after {wait_time}s")
+
+        remaining = max(deadline - time.monotonic(), 0)
+        return WebDriverWait(self.driver, remaining, poll_frequency=self.poll_frequency).until(
+            self.polling_condition(condition, locator, expected, attribute),
+            f"Condition '{condition}' not met for {locator} after {wait_time}s"
+        )
+
+    def until_quiet(self, idle_time=0.5, wait_time=30, watch_dom=False):
+        """
+        Waits until no fetch/XHR request is in flight and there has been no network
+        activity (and, with watch_dom, no DOM mutation) for idle_time seconds.
+
+        When the tracker script cannot run, falls back to polling until the document
+        has finished loading, which is the closest signal available without it.
+
+        :return: True when the page went quiet, False when wait_time ran out first.
+        """
+        deadline = time.monotonic() + wait_time
+        while self.scripts_supported:
+            remaining = deadline - time.monotonic()
+            chunk = min(max(remaining, 0), self.SCRIPT_CHUNK_SECONDS)
+            try:
+                result = self.driver.execute_async_script(
+                    WAIT_FOR_QUIET_JS, int(idle_time * 1000), watch_dom, int(chunk * 1000))
+            except exceptions.JavascriptException as e:
+                if 'unloaded' in str(e):
+                    continue
+                log.warning(f"In-browser quiet wait failed, falling back to polling the document state: {e}")
+                break
+            except exceptions.TimeoutException:
+                # Script timeout shorter than the chunk; keep waiting by polling
+                break
+            if result['met']:
+                return True
+            if time.monotonic() >= deadline:
+                log.warning(f"Page not quiet after {wait_time}s, {result['inFlight']} requests still in flight")
+                return False
+
+        try:
+            WebDriverWait(self.driver, max(deadline - time.monotonic(), 0), poll_frequency=self.poll_frequency).until(
+                lambda driver: driver.execute_script("return document.readyState;") == 'complete')
+            return True
+        except exceptions.TimeoutException:
+            log.warning(f"Page not loaded after {wait_time}s")
+            return False
@@ -1,6 +1,5 @@
 import allure
 import pytest
-import time
 from selenium.common import exceptions
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support import expected_conditions as EC
@@ -14,6 +13,8 @@ from selenium import webdriver
 import logging
 
 from utils.UtilsPackage import UtilsPackage
+from webdriver.Locators import parse_find_args
+from webdriver.WaitEngine import WaitEngine
 
 log = logging
 
@@ -26,105 +27,24 @@ class WebDriverHelper(UtilsPackage):
         # if driver is None:
         #     raise ValueError("Driver cannot be None")
         self.driver = driver
+        self.waits = WaitEngine(driver)
 
     def create_driver(self):
         return webdriver.Chrome()  # Return an instance, not a generator
 
-    def find_element(self, condition, locator, value, wait_time):
+    def find_element(self, condition, locator, *args):
         """
-        This function handles the way that an element is searched
-        """
-
-        element = ""
-        if wait_time:
-            # Custom wait time
-            wait = WebDriverWait(self.driver, wait_time)
-        else:
-            wait = WebDriverWait(self.driver, 30)
+        This function handles the way that an element is searched.
 
+        Accepts find_element(condition, strategy, value, wait_time) with a strategy
+        name such as 'xpath' or 'css', and find_element(condition, locator_tuple, wait_time).
+        Waits in the browser through the same WaitEngine as WebDriverHelperNew.
+        """
         try:
-
-            if condition == 'visible':
-                if locator == 'xpath':
-                    element = wait.until(EC.visibility_of_element_located((By.XPATH, value)))
-                elif locator == 'id':
-                    element = wait.until(EC.visibility_of_element_located((By.ID, value)))
-                elif locator == 'css':
-                    element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, value)))
-                elif locator == 'classname':
-                    element = wait.until(EC.visibility_of_element_located((By.CLASS_NAME, value)))
-                elif locator == 'tagname':
-                    element = wait.until(EC.visibility_of_element_located((By.TAG_NAME, value)))
-                elif locator == 'linktext':
-                    element = wait.until(EC.visibility_of_element_located((By.LINK_TEXT, value)))
-                elif locator == 'partiallinktext':
-                    element = wait.until(EC.visibility_of_element_located((By.PARTIAL_LINK_TEXT, value)))
-                elif locator == 'name':
-                    element = wait.until(EC.visibility_of_element_located((By.NAME, value)))
-                return element
-
-            elif condition == 'selected':
-                if locator == 'xpath':
-                    element = wait.until(EC.element_to_be_selected((By.XPATH, value)))
-                elif locator == 'id':
-                    element = wait.until(EC.element_to_be_selected((By.ID, value)))
-                elif locator == 'css':
-                    element = wait.until(EC.element_to_be_selected((By.CSS_SELECTOR, value)))
-                elif locator == 'classname':
-                    element = wait.until(EC.element_to_be_selected((By.CLASS_NAME, value)))
-                elif locator == 'tagname':
-                    element = wait.until(EC.element_to_be_selected((By.TAG_NAME, value)))
-                elif locator == 'linktext':
-                    element = wait.until(EC.element_to_be_selected((By.LINK_TEXT, value)))
-                elif locator == 'partiallinktext':
-                    element = wait.until(EC.element_to_be_selected((By.PARTIAL_LINK_TEXT, value)))
-                elif locator == 'name':
-                    element = wait.until(EC.element_to_be_selected((By.NAME, value)))
-                return element
-
-            elif condition == 'clickable':
-                if locator == 'xpath':
-                    element = wait.until(EC.element_to_be_clickable((By.XPATH, value)))
-                elif locator == 'id':
-                    element = wait.until(EC.element_to_be_clickable((By.ID, value)))
-                elif locator == 'css':
-                    element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, value)))
-                elif locator == 'classname':
-                    element = wait.until(EC.element_to_be_clickable((By.CLASS_NAME, value)))
-                elif locator == 'tagname':
-                    element = wait.until(EC.element_to_be_clickable((By.TAG_NAME, value)))
-                elif locator == 'linktext':
-                    element = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, value)))
-                elif locator == 'partiallinktext':
-                    element = wait.until(EC.element_to_be_clickable((By.PARTIAL_LINK_TEXT, value)))
-                elif locator == 'name':
-                    element = wait.until(EC.element_to_be_clickable((By.NAME, value)))
-                return element
-
-            elif condition == 'presence':
-                if locator == 'xpath':
-                    element = wait.until(EC.presence_of_element_located((By.XPATH, value)))
-                elif locator == 'id':
-                    element = wait.until(EC.presence_of_element_located((By.ID, value)))
-                elif locator == 'css':
-                    element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, value)))
-                elif locator == 'classname':
-                    element = wait.until(EC.presence_of_element_located((By.CLASS_NAME, value)))
-                elif locator == 'tagname':
-                    element = wait.until(EC.presence_of_element_located((By.TAG_NAME, value)))
-                elif locator == 'linktext':
-                    element = wait.until(EC.presence_of_element_located((By.LINK_TEXT, value)))
-                elif locator == 'partiallinktext':
-                    element = wait.until(EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, value)))
-                elif locator == 'name':
-                    element = wait.until(EC.presence_of_element_located((By.NAME, value)))
-                return element
-
+            locator, wait_time = parse_find_args(locator, args)
+            return self.waits.until(condition, locator, wait_time)
         except Exception as e:
             pytest.fail(str(e))
-            self.driver.quit()
-
-        # return element
 
     def clear_all_text(self, element):
         """
@@ -345,10 +265,10 @@ class WebDriverHelper(UtilsPackage):
         with allure.step('Click on element and accept alert'):
             log.info('try_accept_alert(): Click on element')
             self.click_element(element_xpath, comment)
-            time.sleep(2)
             try:
+                WebDriverWait(self.driver, 2).until(EC.alert_is_present())
                 self.accept_system_alert()
-            except:
+            except exceptions.TimeoutException:
                 log.info('no popup, skip it as expected\n')
 
     def check_checkbox_enabled(self, element_xpath, comment):
@@ -1,3 +1,5 @@
+import sys
+import time
 import allure
 import pytest
 import logging
@@ -10,34 +12,105 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.keys import Keys
 
 from utils.UtilsPackage import UtilsPackage
+from webdriver.BrowserScripts import PAGE_READY_JS, COUNT_ELEMENTS_JS, EXTRACT_ELEMENTS_JS, FILL_FORM_JS, \
+    SET_TEXT_JS, IGNORE_REGIONS_JS
+from webdriver.Locators import parse_find_args
+from webdriver.VisualCheck import VisualComparator
+from webdriver.WaitEngine import WaitEngine
 
 log = logging.getLogger(__name__)
 
 
 class WebDriverHelper(UtilsPackage):
-
-    def __init__(self, driver):
+    # Element cache counters across all helpers of the run
+    cache_stats = {'hits': 0, 'misses': 0}
+    # Baselines and comparison counters shared by all helpers of the run
+    visual = VisualComparator()
+    # Default of fast_text_entry for helpers created without it; set from --fast-text-entry in conftest
+    fast_text_entry_default = False
+    # Poll interval of wait_for_page_ready; each poll is one cheap script call, so poll well below the 0.5 s default
+    page_ready_poll_frequency = 0.05
+
+    def __init__(self, driver, fast_text_entry: bool = None):
         super().__init__()
         if driver is None:
             raise ValueError("Driver cannot be None")
         self.driver = driver
-
-    def find_element(self, condition: str, locator: tuple, wait_time: int = 30):
-        """Finds an element using a locator tuple and a wait condition."""
-        wait = WebDriverWait(self.driver, wait_time)
-        locator_map = {
-            'visible': EC.visibility_of_element_located,
-            'selected': EC.element_to_be_selected,
-            'clickable': EC.element_to_be_clickable,
-            'presence': EC.presence_of_element_located
-        }
-        if condition not in locator_map:
+        # Set text through the native value setter instead of typing it key by key
+        self.fast_text_entry = self.fast_text_entry_default if fast_text_entry is None else fast_text_entry
+        self.waits = WaitEngine(driver)
+        # (condition, locator tuple) -> (element, url of the document it was found in)
+        self._element_cache = {}
+
+    def find_element(self, condition: str, locator, *args, wait_time: int = None):
+        """
+        Finds an element using a locator tuple and a wait condition.
+
+        Accepts find_element(condition, locator_tuple, wait_time=30) and the legacy
+        find_element(condition, strategy, value, wait_time) used by older page objects.
+        Always looks the element up; the helpers below reuse cached elements instead.
+        """
+        if condition not in ('visible', 'selected', 'clickable', 'presence'):
             raise ValueError(f"Unknown condition: {condition}")
+        locator, wait_time = parse_find_args(locator, args + (wait_time,) if wait_time else args)
         try:
-            return wait.until(locator_map[condition](locator))
+            return self.waits.until(condition, locator, wait_time)
         except Exception as e:
             pytest.fail(str(e))
 
+    def _count_cache_lookup(self, outcome, key):
+        WebDriverHelper.cache_stats[outcome] += 1
+        log.debug(f"Element cache {outcome[:-1]} for {key}")
+
+    def invalidate_element_cache(self, locator: tuple = None):
+        """Drops the cached element of a locator, or the whole cache when no locator is given."""
+        if locator is None:
+            self._element_cache.clear()
+        else:
+            for key in [key for key in self._element_cache if key[1] == tuple(locator)]:
+                del self._element_cache[key]
+
+    def _drop_entries_of_other_urls(self):
+        """Drops the cached elements found on another URL, e.g. after a driver.get, a submit or a route change."""
+        if not self._element_cache:
+            return
+        url = self.driver.current_url
+        moved = [key for key, (_, cached_url) in self._element_cache.items() if cached_url != url]
+        if moved:
+            log.debug(f"URL changed to {url}, dropping {len(moved)} cached elements")
+            for key in moved:
+                del self._element_cache[key]
+
+    def _with_element(self, condition: str, locator: tuple, action):
+        """
+        Runs action on the element of locator, reusing the element cached for the same
+        condition and URL. The cache is dropped on navigation, URL changes, frame switches
+        and clicks; a cached element that went stale is resolved again once.
+        """
+        self._drop_entries_of_other_urls()
+        key = (condition, tuple(locator))
+        cached = self._element_cache.get(key)
+        if cached is not None:
+            self._count_cache_lookup('hits', key[1])
+            try:
+                return action(cached[0])
+            except exceptions.StaleElementReferenceException:
+                # One stale element usually means the page re-rendered, so the other cached ones are suspect too
+                log.info(f"Element {locator} went stale, resolving it again")
+                self.invalidate_element_cache()
+        else:
+            self._count_cache_lookup('misses', key[1])
+        element = self.find_element(condition, locator)
+        self._element_cache[key] = (element, self.waits.last_url or self.driver.current_url)
+        return action(element)
+
+    def _click_and_invalidate(self, condition: str, locator: tuple, action):
+        """Like _with_element for actions that may navigate or re-render, so the cache is dropped afterwards."""
+        try:
+            return self._with_element(condition, locator, action)
+        finally:
+            self.invalidate_element_cache()
+
     def get_elements(self, locator: tuple):
         return self.driver.find_elements(*locator)
 
@@ -47,101 +120,109 @@ class WebDriverHelper(UtilsPackage):
         except exceptions.ElementClickInterceptedException:
             self.driver.execute_script("arguments[0].click();", element)
 
-    def clear_all_text(self, element):
-        length = len(element.get_attribute('value'))
-        element.send_keys(length * Keys.BACKSPACE)
+    def clear_all_text(self, element, key_events: bool = False):
+        if self.fast_text_entry and not key_events and self.driver.execute_script(SET_TEXT_JS, element, ""):
+            return
+        # One select-all and delete, whatever the length of the current value
+        select_all = Keys.COMMAND if sys.platform == 'darwin' else Keys.CONTROL
+        element.send_keys(select_all, 'a')
+        element.send_keys(Keys.BACKSPACE)
+
+    def set_text(self, element, text: str, key_events: bool = False):
+        """
+        Replaces the value of an input element with text.
+
+        Types the text by default. In fast text entry mode the value is set in one
+        script call that fires the input/change events frameworks listen to; fields that
+        need real key presses (comboboxes, autocompletes, maxlength, masks that rewrite
+        the value) keep their value and are typed into instead, as with key_events=True.
+        """
+        if self.fast_text_entry and not key_events and self.driver.execute_script(SET_TEXT_JS, element, text):
+            return
+        element.clear()
+        element.send_keys(text)
 
-    def enter_text(self, locator: tuple, text: str, comment: str):
+    def enter_text(self, locator: tuple, text: str, comment: str, key_events: bool = False):
         with allure.step(f"Enter text in {comment}"):
             log.info(f"Entering text '{text}' in {comment}")
-            element = self.find_element('visible', locator)
-            element.clear()
-            element.send_keys(text)
+            self._with_element('visible', locator, lambda element: self.set_text(element, text, key_events))
 
     def click_element(self, locator: tuple, comment: str):
         with allure.step(f"Click element: {comment}"):
             log.info(f"Clicking element: {comment}")
-            element = self.find_element('visible', locator)
-            self.click(element)
+            self._click_and_invalidate('visible', locator, self.click)
 
     def assert_element_attribute(self, locator: tuple, attribute: str, comment: str):
         with allure.step(f"Asserting element attribute: {comment}"):
             log.info(f"Asserting {attribute} exists on {comment}")
-            element = self.find_element('visible', locator)
-            assert element.get_attribute(attribute)
+            assert self._with_element('visible', locator, lambda element: element.get_attribute(attribute))
 
     def get_element_attribute_value(self, locator: tuple, comment: str):
         with allure.step(f"Getting attribute value from {comment}"):
             log.info(f"Getting attribute value from {comment}")
-            return self.find_element('visible', locator).get_attribute("value")
+            return self._with_element('visible', locator, lambda element: element.get_attribute("value"))
 
     def wait_for_text_in_element(self, locator: tuple, text: str, wait_time: int = 30):
-        wait = WebDriverWait(self.driver, wait_time)
-        wait.until(EC.text_to_be_present_in_element(locator, text))
+        self.waits.until('text', locator, wait_time, expected=text)
 
     def is_element_enabled(self, locator: tuple):
-        return self.find_element('presence', locator).is_enabled()
+        return self._with_element('presence', locator, lambda element: element.is_enabled())
 
     def is_element_displayed(self, locator: tuple):
-        return self.find_element('presence', locator).is_displayed()
+        return self._with_element('presence', locator, lambda element: element.is_displayed())
 
     def wait_for_element_to_disappear(self, locator: tuple, wait_time: int = 30):
-        WebDriverWait(self.driver, wait_time).until(EC.invisibility_of_element_located(locator))
+        self.waits.until('invisible', locator, wait_time)
 
     def scroll_to_element(self, locator: tuple):
-        element = self.find_element('visible', locator)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        self._with_element('visible', locator,
+                           lambda element: self.driver.execute_script("arguments[0].scrollIntoView(true);", element))
 
     def hover_over_element(self, locator: tuple):
-        element = self.find_element('visible', locator)
-        ActionChains(self.driver).move_to_element(element).perform()
+        self._with_element('visible', locator,
+                           lambda element: ActionChains(self.driver).move_to_element(element).perform())
 
     def get_element_text(self, locator: tuple, comment: str = ""):
         with allure.step(f"Getting text from element: {comment}"):
             log.info(f"Getting text from element: {comment}")
-            element = self.find_element('visible', locator)
-            return element.text
+            return self._with_element('visible', locator, lambda element: element.text)
 
     def select_option_from_dropdown(self, select_locator: tuple, option_text: str, comment: str):
         with allure.step(f"Selecting dropdown option {option_text} for {comment}"):
-            select_elem = Select(self.find_element('visible', select_locator))
-            select_elem.select_by_visible_text(option_text)
+            self._with_element('visible', select_locator,
+                               lambda element: Select(element).select_by_visible_text(option_text))
 
     def select_option_by_index(self, select_locator: tuple, index: int, comment: str = ""):
         with allure.step(f"Selecting option index {index} for {comment}"):
-            select_elem = Select(self.find_element('visible', select_locator))
-            select_elem.select_by_index(index)
+            self._with_element('visible', select_locator, lambda element: Select(element).select_by_index(index))
 
     def select_option_by_value(self, select_locator: tuple, value: str, comment: str = ""):
         with allure.step(f"Selecting value {value} in {comment}"):
-            select_elem = Select(self.find_element('visible', select_locator))
-            select_elem.select_by_value(value)
+            self._with_element('visible', select_locator, lambda element: Select(element).select_by_value(value))
 
     def get_all_dropdown_options(self, select_locator: tuple, comment: str = ""):
         with allure.step(f"Getting all options from dropdown: {comment}"):
-            select_elem = Select(self.find_element('visible', select_locator))
-            return [opt.text for opt in select_elem.options]
+            self.find_element('visible', select_locator)
+            options = {'locator': (By.TAG_NAME, 'option'), 'field': 'prop:text', 'all': True}
+            return self.extract_elements(select_locator, {'options': options})[0]['options']
 
     def double_click(self, locator: tuple, comment: str = ""):
         with allure.step(f"Double-clicking on: {comment}"):
-            element = self.find_element('visible', locator)
-            ActionChains(self.driver).double_click(element).perform()
+            self._click_and_invalidate('visible', locator,
+                                       lambda element: ActionChains(self.driver).double_click(element).perform())
 
     def drag_and_drop(self, source: tuple, target: tuple):
-        src_elem = self.find_element('visible', source)
-        tgt_elem = self.find_element('visible', target)
-        ActionChains(self.driver).drag_and_drop(src_elem, tgt_elem).perform()
+        self._click_and_invalidate('visible', source, lambda src_elem: ActionChains(self.driver).drag_and_drop(
+            src_elem, self.find_element('visible', target)).perform())
 
     def upload_file(self, locator: tuple, file_path: str, comment: str = ""):
         with allure.step(f"Uploading file to: {comment}"):
-            file_input = self.find_element('visible', locator)
-            file_input.send_keys(file_path)
+            self._with_element('visible', locator, lambda file_input: file_input.send_keys(file_path))
 
     def retry_click(self, locator: tuple, retries: int = 3, comment: str = ""):
         for attempt in range(retries):
             try:
-                element = self.find_element('clickable', locator)
-                element.click()
+                self._click_and_invalidate('clickable', locator, lambda element: element.click())
                 return
             except exceptions.ElementClickInterceptedException:
                 if attempt < retries - 1:
@@ -150,52 +231,107 @@ class WebDriverHelper(UtilsPackage):
                     pytest.fail(f"Failed to click after {retries} attempts: {comment}")
 
     def wait_for_element_attribute(self, locator: tuple, attribute: str, expected_value: str, wait_time: int = 30):
-        WebDriverWait(self.driver, wait_time).until(
-            lambda driver: driver.find_element(*locator).get_attribute(attribute) == expected_value
-        )
+        self.waits.until('attribute', locator, wait_time, expected=expected_value, attribute=attribute)
 
     def check_element_attribute_value(self, locator: tuple, attribute: str, expected_value: str, comment: str = ""):
-        element = self.find_element('visible', locator)
-        actual_value = element.get_attribute(attribute)
+        actual_value = self._with_element('visible', locator, lambda element: element.get_attribute(attribute))
         assert actual_value == expected_value, \
             f"Expected {attribute} to be {expected_value}, but got {actual_value}"
 
     def toggle_checkbox(self, locator: tuple, comment: str = ""):
-        checkbox = self.find_element('clickable', locator)
-        checkbox.click()
+        self._click_and_invalidate('clickable', locator, lambda checkbox: checkbox.click())
 
     def set_checkbox(self, locator: tuple, desired_state: bool, comment: str = ""):
-        checkbox = self.find_element('clickable', locator)
-        if checkbox.is_selected() != desired_state:
-            checkbox.click()
+        def set_state(checkbox):
+            if checkbox.is_selected() != desired_state:
+                checkbox.click()
+        self._click_and_invalidate('clickable', locator, set_state)
 
     def get_element_count(self, locator: tuple):
-        return len(self.driver.find_elements(*locator))
+        """Counts the matches inside the page, so the answer is immediate whatever the implicit wait."""
+        return self.driver.execute_script(COUNT_ELEMENTS_JS, locator[0], locator[1])
 
     def does_element_exist(self, locator: tuple):
-        return len(self.driver.find_elements(*locator)) > 0
+        return self.get_element_count(locator) > 0
+
+    def is_element_absent(self, locator: tuple):
+        return self.get_element_count(locator) == 0
 
     def wait_until_element_contains_text(self, locator: tuple, expected_text: str, wait_time: int = 30):
-        WebDriverWait(self.driver, wait_time).until(
-            lambda driver: expected_text in driver.find_element(*locator).text
-        )
+        self.waits.until('text', locator, wait_time, expected=expected_text)
 
     def focus_on_element(self, locator: tuple):
-        element = self.find_element('visible', locator)
-        self.driver.execute_script("arguments[0].focus();", element)
+        self._with_element('visible', locator, lambda element: self.driver.execute_script("arguments[0].focus();",
+                                                                                          element))
 
     def get_element_css_value(self, locator: tuple, css_property: str, comment: str = ""):
-        element = self.find_element('visible', locator)
-        return element.value_of_css_property(css_property)
+        return self._with_element('visible', locator, lambda element: element.value_of_css_property(css_property))
 
     def get_elements_text(self, locator: tuple, comment: str = ""):
-        return [el.text for el in self.get_elements(locator)]
+        return [row['text'] for row in self.extract_elements(locator, {'text': 'text'})]
+
+    def extract_elements(self, locator: tuple, fields: dict):
+        """
+        Reads fields of every element matching locator in a single script call and
+        returns one plain dict per element.
+
+        A field spec is either a string or a child spec:
+            'text'          -> trimmed innerText (close to WebElement.text)
+            'attr:<name>'   -> element.getAttribute(name)
+            'prop:<name>'   -> element[name], e.g. 'prop:value' or 'prop:innerText'
+            'css:<name>'    -> computed style property
+            {'locator': (By.XPATH, './/span'), 'field': 'text', 'all': True}
+                            -> the field of the first child matching locator (None if absent),
+                               or a list over all of them when 'all' is set
+
+        Example: extract_elements((By.CLASS_NAME, 'card'), {'title': 'text', 'link': 'attr:href'})
+        """
+        specs = {key: dict(spec, locator=list(spec['locator'])) if isinstance(spec, dict) else spec
+                 for key, spec in fields.items()}
+        return self.driver.execute_script(EXTRACT_ELEMENTS_JS, locator[0], locator[1], specs)
 
     def open_new_tab_with_url(self, url: str):
         self.driver.execute_script(f"window.open('{url}');")
 
-    def go_to_url(self, url: str):
+    def go_to_url(self, url: str, page=None, wait_time: int = 30):
+        """
+        Navigates to url. When a page object (or class) is given, returns as soon as
+        its readiness signature is satisfied instead of relying on the load strategy.
+        """
+        self.invalidate_element_cache()
         self.driver.get(url)
+        if page is not None:
+            self.wait_for_page_ready(page, wait_time)
+
+    def wait_for_network_idle(self, idle_time: float = 0.5, wait_time: int = 30):
+        """
+        Returns as soon as no fetch/XHR request is in flight and the network has been
+        quiet for idle_time seconds. Logs a warning and returns False if the page never
+        goes quiet within wait_time, e.g. because of long polling.
+        """
+        with allure.step("Waiting for network idle"):
+            return self.waits.until_quiet(idle_time, wait_time)
+
+    def wait_for_app_settled(self, idle_time: float = 0.5, wait_time: int = 30):
+        """Like wait_for_network_idle, but also waits for the framework to stop re-rendering the DOM."""
+        with allure.step("Waiting for application to settle"):
+            return self.waits.until_quiet(idle_time, wait_time, watch_dom=True)
+
+    def wait_for_page_ready(self, page, wait_time: int = 30):
+        """
+        Waits until the readiness signature of a page object is met: every locator in
+        READY_LOCATORS has a visible match and the READY_SCRIPT JS expression, if any,
+        is truthy. Each poll is a single script call, repeated every page_ready_poll_frequency seconds.
+        """
+        locators = [list(locator) for locator in getattr(page, 'READY_LOCATORS', ())]
+        script = getattr(page, 'READY_SCRIPT', None)
+        with allure.step(f"Waiting for {getattr(page, '__name__', type(page).__name__)} to be ready"):
+            try:
+                WebDriverWait(self.driver, wait_time, poll_frequency=self.page_ready_poll_frequency).until(
+                    lambda driver: driver.execute_script(PAGE_READY_JS, locators, script)
+                )
+            except exceptions.TimeoutException:
+                pytest.fail(f"Page not ready after {wait_time}s: {locators} {script or ''}")
 
     def check_current_url(self, expected_url: str):
         assert self.driver.current_url == expected_url
@@ -204,6 +340,7 @@ class WebDriverHelper(UtilsPackage):
         return self.driver.current_url
 
     def refresh(self):
+        self.invalidate_element_cache()
         self.driver.refresh()
 
     def accept_system_alert(self):
@@ -219,9 +356,11 @@ class WebDriverHelper(UtilsPackage):
         WebDriverWait(self.driver, wait_time).until(EC.alert_is_present())
 
     def switch_to_iframe(self, iframe_element):
+        self.invalidate_element_cache()
         self.driver.switch_to.frame(iframe_element)
 
     def switch_to_default_content_from_iframe(self):
+        self.invalidate_element_cache()
         self.driver.switch_to.default_content()
 
     def quit_driver(self):
@@ -234,9 +373,91 @@ class WebDriverHelper(UtilsPackage):
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
 
     def wait_for_element_to_appear(self, locator: tuple, wait_time: int = 30):
-        WebDriverWait(self.driver, wait_time).until(EC.visibility_of_element_located(locator))
+        self.waits.until('visible', locator, wait_time)
+
+    def clear_and_enter_text(self, locator: tuple, text: str, comment: str = "", key_events: bool = False):
+        self._with_element('visible', locator, lambda element: self.set_text(element, text, key_events))
+
+    def fill_form(self, fields: dict, submit: tuple = None, comment: str = "form", key_events: bool = False,
+                  wait_time: int = 30):
+        """
+        Fills several fields and optionally clicks a submit control in one go.
+
+        fields maps locator tuples to values (bool for checkboxes and radio buttons).
+        By default everything happens in a single script call: values are set through
+        the native value setter and focus/input/change/blur are fired, which is what
+        React, Vue and MUI inputs listen to. Text fields that react to individual key
+        presses are detected like in set_text (comboboxes, aria-autocomplete, datalists,
+        maxlength) and typed afterwards, together with the submit click, as one
+        ActionChains sequence. key_events=True types every field.
+        """
+        with allure.step(f"Fill {comment}"):
+            log.info(f"Filling {len(fields)} fields in {comment}")
+            if submit:
+                # Submitting may navigate or re-render the page
+                self.invalidate_element_cache()
+            if key_events:
+                self._type_form(fields, submit, wait_time)
+                return
 
-    def clear_and_enter_text(self, locator: tuple, text: str, comment: str = ""):
-        element = self.find_element('visible', locator)
-        element.clear()
-        element.send_keys(text)
+            locators = list(fields)
+            values = [[locator[0], locator[1], value if isinstance(value, bool) else str(value)]
+                      for locator, value in fields.items()]
+            submit_locator = list(submit) if submit else None
+            deadline = time.monotonic() + wait_time
+            while True:
+                result = self.driver.execute_script(FILL_FORM_JS, values, submit_locator)
+                if not result['missing']:
+                    break
+                # Nothing was filled; wait for the controls that are not visible yet and try again
+                pending = [submit if index == -1 else locators[index] for index in result['missing']]
+                try:
+                    for locator in pending:
+                        self.waits.until('visible', locator, max(deadline - time.monotonic(), 0))
+                except exceptions.TimeoutException:
+                    pytest.fail(f"Form fields not visible after {wait_time}s: {pending}")
+
+            if result['keyEvents']:
+                typed = {locators[index]: fields[locators[index]] for index in result['keyEvents']}
+                log.info(f"Typing {len(typed)} fields of {comment} that need key events: {list(typed)}")
+                self._type_form(typed, submit, max(deadline - time.monotonic(), 1))
+
+    def _type_form(self, fields: dict, submit: tuple, wait_time: int):
+        select_all = Keys.COMMAND if sys.platform == 'darwin' else Keys.CONTROL
+        elements = [(self.find_element('visible', locator, wait_time), value) for locator, value in fields.items()]
+        submit_element = self.find_element('clickable', submit, wait_time) if submit else None
+
+        actions = ActionChains(self.driver)
+        for element, value in elements:
+            if isinstance(value, bool):
+                if element.is_selected() != value:
+                    actions.click(element)
+                continue
+            actions.click(element).key_down(select_all).send_keys('a').key_up(select_all) \
+                .send_keys(Keys.BACKSPACE).send_keys(str(value))
+        if submit_element is not None:
+            actions.click(submit_element)
+        actions.perform()
+
+    def check_visual(self, name: str, locator: tuple = None, ignore: tuple = (), threshold: float = None,
+                     comment: str = ""):
+        """
+        Compares a screenshot of the viewport, or of the element at locator, with the
+        baseline stored as name under testResults/VisualBaselines; the first run stores
+        the baseline. Elements matching the locators in ignore are masked out.
+        Fails the test with the diff image attached when a changed region scores below
+        the SSIM threshold.
+        """
+        with allure.step(f"Visual check: {comment or name}"):
+            element = self.find_element('visible', locator) if locator else None
+            png = element.screenshot_as_png if element is not None else self.driver.get_screenshot_as_png()
+            regions = self.driver.execute_script(
+                IGNORE_REGIONS_JS, [list(ignored) for ignored in ignore], element) if ignore else []
+            result = self.visual.compare(name, png, regions, threshold)
+            log.info(f"Visual check {name}: score {result['score']:.4f}")
+            if not result['passed']:
+                allure.attach.file(result['diff_path'], name=f"Visual diff: {name}",
+                                   attachment_type=allure.attachment_type.PNG)
+                pytest.fail(f"Visual check {name} failed: {result.get('reason') or result['regions']} "
+                            f"(score {result['score']:.4f}), see {result['diff_path']}")
+            return result